@@ -1711,27 +1711,24 @@ Use the Read tool to read `user_request.md` for the user's request.
         Returns:
             Tuple of (parsed_data, error_message). One will be None.
         """
-        if not Path(file_path).exists():
+        # Read file as bytes; json.loads decodes them without the text I/O stack
+        try:
+            raw_content = Path(file_path).read_bytes()
+            logger.debug("Read %d bytes from structured output file", len(raw_content))
+        except FileNotFoundError:
             logger.debug("Structured output file not found: %s", file_path)
             return None, None
-
-        logger.debug("Reading structured output file: %s", file_path)
-
-        # Read file
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                file_content = f.read()
-            logger.debug("Read %d bytes from structured output file", len(file_content))
         except Exception as e:
             logger.error("Failed to read structured output file: %s", e)
             return None, f"Failed to read file: {e}"
 
         # Parse JSON
         try:
-            parsed_data = json.loads(file_content)
+            parsed_data = json.loads(raw_content)
             logger.debug("Successfully parsed JSON from structured output file")
-        except json.JSONDecodeError as e:
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
             logger.error("Invalid JSON in structured output file: %s", e)
+            file_content = raw_content.decode("utf-8", errors="replace")
             return (
                 None,
                 f"The file content isn't formatted correctly: {e}\nFile content:\n{file_content}",
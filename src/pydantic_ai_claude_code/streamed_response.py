@@ -20,6 +20,31 @@ from .types import ClaudeStreamEvent
 
 logger = logging.getLogger(__name__)
 
+# CLI stream event types that carry nothing the streamed response needs
+_SKIPPED_EVENT_TYPES = frozenset(
+    {"message_start", "message_delta", "message_stop", "assistant"}
+)
+
+# How long the event iterator waits for new buffered events before re-checking
+_EVENT_POLL_INTERVAL_SECONDS = 0.01
+
+
+def _first_block_text_delta(event: ClaudeStreamEvent) -> str | None:
+    """Return the text of a text_delta for content block 0, if any.
+
+    Args:
+        event: content_block_delta stream event
+
+    Returns:
+        Non-empty delta text, or None if the event carries no usable text
+    """
+    if event.get("index") != 0:
+        return None
+    delta = event.get("delta")
+    if not isinstance(delta, dict) or delta.get("type") != "text_delta":
+        return None
+    return delta.get("text") or None
+
 
 class ClaudeCodeStreamedResponse(StreamedResponse):
     """StreamedResponse implementation for Claude Code CLI."""
@@ -50,7 +75,10 @@ class ClaudeCodeStreamedResponse(StreamedResponse):
         self._usage: RequestUsage = RequestUsage()
         # Buffer events as they arrive from background task
         self._buffered_events: list[ModelResponseStreamEvent] = []
-        self._stream_complete = asyncio.Event()
+        # Resolved (with None) once the background task has consumed the stream
+        self._stream_complete: asyncio.Future[None] = (
+            asyncio.get_running_loop().create_future()
+        )
         self._background_task: asyncio.Task[None] | None = None
         # Start background consumption immediately
         self._background_task = asyncio.create_task(self._consume_stream_background())
@@ -152,37 +180,19 @@ class ClaudeCodeStreamedResponse(StreamedResponse):
     ) -> tuple[str, bool, bool]:
         """Process text chunk with marker detection.
 
+        Text is only accumulated while waiting for the marker; once streaming has
+        started each chunk is forwarded as a delta without growing the buffer.
+
         Args:
             text_chunk: New text to process
-            accumulated_text: Text accumulated so far
+            accumulated_text: Text accumulated so far (before the marker)
             streaming_started: Whether streaming has started
             text_started: Whether text events have started
 
         Returns:
             Tuple of (updated_accumulated_text, updated_streaming_started, updated_text_started)
         """
-        accumulated_text += text_chunk
-
-        if not streaming_started and self._streaming_marker:
-            if self._streaming_marker in accumulated_text:
-                # Marker found - start streaming from after marker
-                marker_end = accumulated_text.index(self._streaming_marker) + len(
-                    self._streaming_marker
-                )
-                remaining_text = accumulated_text[marker_end:].lstrip()
-                accumulated_text = remaining_text
-
-                if remaining_text:
-                    start_event = PartStartEvent(index=0, part=TextPart(content=""))
-                    self._buffered_events.append(start_event)
-                    text_started = True
-
-                    delta_event = PartDeltaEvent(
-                        index=0, delta=TextPartDelta(content_delta=remaining_text)
-                    )
-                    self._buffered_events.append(delta_event)
-                return accumulated_text, True, text_started
-        elif streaming_started:
+        if streaming_started:
             # Already streaming - add text events
             if not text_started:
                 start_event = PartStartEvent(index=0, part=TextPart(content=""))
@@ -193,8 +203,31 @@ class ClaudeCodeStreamedResponse(StreamedResponse):
                 index=0, delta=TextPartDelta(content_delta=text_chunk)
             )
             self._buffered_events.append(delta_event)
+            return accumulated_text, streaming_started, text_started
 
-        return accumulated_text, streaming_started, text_started
+        marker = self._streaming_marker
+        if not marker:
+            return accumulated_text, streaming_started, text_started
+
+        # Only the tail that could hold a marker split across chunks is rescanned
+        search_start = max(0, len(accumulated_text) - len(marker) + 1)
+        accumulated_text += text_chunk
+        marker_pos = accumulated_text.find(marker, search_start)
+        if marker_pos == -1:
+            return accumulated_text, streaming_started, text_started
+
+        # Marker found - start streaming from after marker
+        remaining_text = accumulated_text[marker_pos + len(marker) :].lstrip()
+        if remaining_text:
+            start_event = PartStartEvent(index=0, part=TextPart(content=""))
+            self._buffered_events.append(start_event)
+            text_started = True
+
+            delta_event = PartDeltaEvent(
+                index=0, delta=TextPartDelta(content_delta=remaining_text)
+            )
+            self._buffered_events.append(delta_event)
+        return remaining_text, True, text_started
 
     async def _consume_stream_background(self) -> None:
         """Consume CLI stream in background and populate buffer.
@@ -213,19 +246,12 @@ class ClaudeCodeStreamedResponse(StreamedResponse):
                 event_count += 1
                 event_type = event.get("type")
 
-                if event_type == "message_start":
+                if event_type in _SKIPPED_EVENT_TYPES:
                     continue
 
                 if event_type == "content_block_delta":
-                    # Only process first content block
-                    if event.get("index") != 0:
-                        continue
-
-                    delta = event.get("delta", {})
-                    if not (isinstance(delta, dict) and delta.get("type") == "text_delta"):
-                        continue
-
-                    text_chunk = delta.get("text", "")
+                    # Text deltas dominate the stream; only the first block is used
+                    text_chunk = _first_block_text_delta(event)
                     if not text_chunk:
                         continue
 
@@ -234,9 +260,6 @@ class ClaudeCodeStreamedResponse(StreamedResponse):
                         text_chunk, accumulated_text, streaming_started, text_started
                     )
 
-                elif event_type in ("message_delta", "message_stop", "assistant"):
-                    continue
-
                 elif event_type == "result":
                     result_event = self._handle_result_event(event, event_count)
                     self._buffered_events.append(result_event)
@@ -244,7 +267,8 @@ class ClaudeCodeStreamedResponse(StreamedResponse):
             logger.debug("Background stream consumption complete, buffered %d events", len(self._buffered_events))
         finally:
             # Signal that stream is complete
-            self._stream_complete.set()
+            if not self._stream_complete.done():
+                self._stream_complete.set_result(None)
 
     async def _get_event_iterator(self) -> AsyncIterator[ModelResponseStreamEvent]:
         """Get event iterator for streaming.
@@ -262,12 +286,14 @@ class ClaudeCodeStreamedResponse(StreamedResponse):
         while True:
             # Wait for more events or completion
             while index >= len(self._buffered_events):
-                if self._stream_complete.is_set():
+                if self._stream_complete.done():
                     # Stream finished and we've yielded all events
                     logger.debug("Event iterator complete, yielded %d events", index)
                     return
-                # Wait a bit for more events
-                await asyncio.sleep(0.01)
+                # Wait for more events; completion wakes the wait immediately
+                await asyncio.wait(
+                    {self._stream_complete}, timeout=_EVENT_POLL_INTERVAL_SECONDS
+                )
 
             # Yield the next event
             event = self._buffered_events[index]
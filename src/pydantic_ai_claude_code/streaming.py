@@ -42,7 +42,8 @@ async def run_claude_streaming(
             break
 
         try:
-            event = json.loads(line.decode().strip())
+            # json.loads accepts bytes and surrounding whitespace directly
+            event = json.loads(line)
             event_count += 1
 
             # Unwrap stream_event wrapper (from verbose mode)
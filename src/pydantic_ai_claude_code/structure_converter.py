@@ -6,11 +6,37 @@ and back, maintaining exact type fidelity throughout the round-trip conversion.
 
 from __future__ import annotations
 
+import functools
+import json
+import os
+import threading
+from collections.abc import Callable, Iterable
+from enum import IntEnum
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, NamedTuple, TypeVar, cast
 
 from .utils import convert_primitive_value
 
+# First read size for field files; larger files are finished with one sized read
+_READ_CHUNK_SIZE = 64 * 1024
+
+# posix_fadvise is unavailable on macOS and Windows
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+# os.readv (reading into a preallocated buffer) is unavailable on Windows
+_HAS_READV = hasattr(os, "readv")
+
+# Stands in for the per-request working directory in cached instructions
+_TEMP_DIR_PLACEHOLDER = "\x00temp_dir\x00"
+
+# Types whose conversion tolerates surrounding whitespace without strip()
+_WHITESPACE_TOLERANT_TYPES = frozenset({"integer", "number"})
+
+# Per-thread scratch buffers for field file reads
+_read_buffers = threading.local()
+
+_T = TypeVar("_T")
+
 
 def _resolve_schema_ref(field_schema: dict[str, Any], root_schema: dict[str, Any]) -> dict[str, Any]:
     """Resolve $ref references in JSON schema.
@@ -249,61 +275,341 @@ def read_structure_from_filesystem(
     if root_schema is None:
         root_schema = schema
 
-    if not base_path.exists():
+    # Paths are plain strings below this point to avoid Path allocations per file
+    base_dir = os.fspath(base_path)
+
+    # The listing doubles as the existence check, so no separate stat is needed
+    try:
+        entry_kinds = _scan_entry_kinds(base_dir)
+    except FileNotFoundError:
         raise RuntimeError(
             f"Working directory not found.\n"
             f"Expected: {base_path}\n"
             f"Please create it with: mkdir -p {base_path}"
-        )
+        ) from None
 
-    properties = schema.get("properties", {})
-    required_fields = schema.get("required", [])
-    result: dict[str, Any] = {}
+    return _read_fields(
+        _get_field_plans(schema, root_schema), base_dir, root_schema, entry_kinds
+    )
 
-    for field_name, field_schema in properties.items():
+
+class _FieldKind(IntEnum):
+    """How a field is stored on disk, resolved once when a plan is compiled."""
+
+    SCALAR = 0  # name.txt
+    PRIMITIVE_ARRAY = 1  # name/NNNN.txt
+    OBJECT_ARRAY = 2  # name/NNNN/
+    OBJECT = 3  # name/
+
+
+class _FieldPlan(NamedTuple):
+    """Precomputed reading instructions for one schema property."""
+
+    name: str
+    entry_name: str  # File or directory name on disk
+    kind: _FieldKind
+    field_type: str  # "array", "object" or a scalar type
+    required: bool
+    nullable: bool
+    schema: dict[str, Any]  # Field schema with $ref resolved
+    item_type: str | None  # Non-null item type of array fields
+    # Plans for nested object fields or object array items; None for scalars,
+    # primitive arrays and recursive $refs, which are compiled when read
+    children: tuple[_FieldPlan, ...] | None
+
+
+def _get_field_plans(
+    schema: dict[str, Any], root_schema: dict[str, Any]
+) -> tuple[_FieldPlan, ...]:
+    """Get the cached field plans for an object schema.
+
+    Output tools reuse the same schema across requests, so plans are cached by
+    the JSON of the schema and the definitions its $refs resolve to. Keys are
+    not sorted so that property order, and thus result order, is preserved.
+
+    Args:
+        schema: Object schema whose properties should be read
+        root_schema: Root schema for resolving $ref
+
+    Returns:
+        Field plans in property order
+    """
+    schema_key = json.dumps([schema, root_schema.get("$defs")])
+    return _compile_field_plans(schema_key)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_field_plans(schema_key: str) -> tuple[_FieldPlan, ...]:
+    """Compile field plans from a canonical schema key.
+
+    Args:
+        schema_key: JSON of [schema, root $defs] as built by _get_field_plans
+
+    Returns:
+        Field plans in property order
+    """
+    schema, defs = json.loads(schema_key)
+    root_schema = {"$defs": defs} if defs else {}
+    return _build_field_plans(schema, root_schema, frozenset())
+
+
+def _build_field_plans(
+    schema: dict[str, Any],
+    root_schema: dict[str, Any],
+    ref_path: frozenset[str],
+) -> tuple[_FieldPlan, ...]:
+    """Build field plans for an object schema, including nested objects.
+
+    Args:
+        schema: Object schema whose properties should be read
+        root_schema: Root schema for resolving $ref
+        ref_path: $refs being compiled by enclosing plans
+
+    Returns:
+        Field plans in property order
+    """
+    required_fields = set(schema.get("required", []))
+
+    plans = []
+    for field_name, raw_field_schema in schema.get("properties", {}).items():
         # Resolve $ref if present
-        field_schema = _resolve_schema_ref(field_schema, root_schema)
+        field_schema = _resolve_schema_ref(raw_field_schema, root_schema)
         field_type = field_schema.get("type", "string")
-        is_required = field_name in required_fields
-        is_nullable = _is_nullable(field_schema)
+        kind = _FieldKind.SCALAR
+        item_type = None
+        children = None
+        if field_type == "array":
+            kind = _FieldKind.PRIMITIVE_ARRAY
+            raw_items_schema = field_schema.get("items", {})
+            items_schema = _resolve_schema_ref(raw_items_schema, root_schema)
+            item_type = _get_non_null_type(items_schema) or "string"
+            if item_type == "object":
+                kind = _FieldKind.OBJECT_ARRAY
+                children = _build_nested_plans(
+                    _get_non_null_schema(items_schema),
+                    raw_items_schema,
+                    root_schema,
+                    ref_path,
+                )
+        elif field_type == "object":
+            kind = _FieldKind.OBJECT
+            children = _build_nested_plans(
+                field_schema, raw_field_schema, root_schema, ref_path
+            )
 
-        # Check if path exists for this field
-        if field_type in ("array", "object"):
-            field_path = base_path / field_name
-        else:
-            field_path = base_path / f"{field_name}.txt"
+        plans.append(
+            _FieldPlan(
+                name=field_name,
+                entry_name=(
+                    f"{field_name}.txt" if kind is _FieldKind.SCALAR else field_name
+                ),
+                kind=kind,
+                field_type=field_type,
+                required=field_name in required_fields,
+                nullable=_is_nullable(field_schema),
+                schema=field_schema,
+                item_type=item_type,
+                children=children,
+            )
+        )
+    return tuple(plans)
+
+
+def _build_nested_plans(
+    schema: dict[str, Any],
+    raw_schema: dict[str, Any],
+    root_schema: dict[str, Any],
+    ref_path: frozenset[str],
+) -> tuple[_FieldPlan, ...] | None:
+    """Build the plans of a nested object unless its $ref is already in progress.
+
+    Args:
+        schema: Resolved object schema
+        raw_schema: Schema as written, possibly a $ref
+        root_schema: Root schema for resolving $ref
+        ref_path: $refs being compiled by enclosing plans
+
+    Returns:
+        Nested field plans, or None for a recursive $ref
+    """
+    ref = raw_schema.get("$ref")
+    if ref is None:
+        return _build_field_plans(schema, root_schema, ref_path)
+    if ref in ref_path:
+        # Recursive model: compile this level when it is actually read
+        return None
+    return _build_field_plans(schema, root_schema, ref_path | {ref})
+
+
+def _get_nested_plans(
+    plan: _FieldPlan, root_schema: dict[str, Any]
+) -> tuple[_FieldPlan, ...]:
+    """Get the plans for an object field or the items of an object array.
+
+    Args:
+        plan: Plan of an object field or object array field
+        root_schema: Root schema for resolving $ref
+
+    Returns:
+        Nested field plans
+    """
+    if plan.children is not None:
+        return plan.children
+
+    schema = plan.schema
+    if plan.kind is _FieldKind.OBJECT_ARRAY:
+        items_schema = _resolve_schema_ref(schema.get("items", {}), root_schema)
+        schema = _get_non_null_schema(items_schema)
+    return _get_field_plans(schema, root_schema)
+
+
+def _read_fields(
+    plans: tuple[_FieldPlan, ...],
+    base_path: str,
+    root_schema: dict[str, Any],
+    entry_kinds: dict[str, bool] | None = None,
+) -> dict[str, Any]:
+    """Read the fields described by precompiled plans from a directory.
+
+    Args:
+        plans: Field plans for the object stored in base_path
+        base_path: Existing directory holding the field files
+        root_schema: Root schema for resolving $ref
+        entry_kinds: Listing of base_path if already scanned by the caller
+
+    Returns:
+        Assembled data dictionary
+    """
+    result: dict[str, Any] = {}
+
+    # One directory listing replaces exists/is_dir stat calls per field
+    if entry_kinds is None:
+        entry_kinds = _scan_entry_kinds(base_path)
+
+    for plan in plans:
+        is_dir = entry_kinds.get(plan.entry_name)
 
         # Handle missing files/directories
-        if not field_path.exists():
-            if is_required and is_nullable:
+        if is_dir is None:
+            if plan.required and plan.nullable:
                 # Required but nullable - missing file means None
-                result[field_name] = None
+                result[plan.name] = None
                 continue
-            elif not is_required:
+            elif not plan.required:
                 # Optional field - skip it
                 continue
             # else: required and not nullable - will raise error in read functions below
 
         # Read the field (will raise error if required but missing and not nullable)
-        if field_type == "array":
-            result[field_name] = _read_array_field(field_name, field_schema, base_path, root_schema)
-        elif field_type == "object":
-            result[field_name] = _read_object_field(field_name, field_schema, base_path, root_schema)
+        if plan.kind is _FieldKind.SCALAR:
+            result[plan.name] = _read_scalar_field(
+                plan.name, plan.field_type, base_path, is_dir is not None
+            )
+        elif plan.kind is _FieldKind.OBJECT:
+            result[plan.name] = _read_object_field(plan, base_path, root_schema, is_dir)
         else:
-            result[field_name] = _read_scalar_field(field_name, field_type, base_path)
+            result[plan.name] = _read_array_field(plan, base_path, root_schema, is_dir)
 
     return result
 
 
+def _scan_entry_kinds(directory: str) -> dict[str, bool]:
+    """List all entries of a directory with a single scan.
+
+    Args:
+        directory: Directory to list
+
+    Returns:
+        Mapping of entry name to whether the entry is a directory
+
+    Raises:
+        RuntimeError: If the path is a file rather than a directory
+    """
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name: entry.is_dir() for entry in entries}
+    except NotADirectoryError:
+        raise RuntimeError(
+            f"Expected directory but found file: {directory}\n"
+            f"Remove the file and create a directory instead:\n"
+            f"rm {directory} && mkdir -p {directory}"
+        ) from None
+
+
+def _get_read_buffer() -> bytearray:
+    """Get this thread's reusable buffer for first reads of field files.
+
+    Returns:
+        Buffer of _READ_CHUNK_SIZE bytes owned by the current thread
+    """
+    buffer: bytearray | None = getattr(_read_buffers, "buffer", None)
+    if buffer is None:
+        buffer = _read_buffers.buffer = bytearray(_READ_CHUNK_SIZE)
+    return buffer
+
+
+def _read_text_file(file_path: str) -> str:
+    """Read a field file as UTF-8 text using unbuffered descriptor reads.
+
+    Field files are small and numerous (one per scalar and per array item), so
+    this skips the buffered text I/O stack of Path.read_text() and its extra
+    fstat/ioctl/lseek calls. The first read goes into a reusable per-thread
+    buffer (where os.readv exists) and is decoded straight from it, so small
+    files allocate no intermediate bytes object. A short first read means EOF
+    for a regular file, so small files take a single read; larger files advise
+    sequential readahead where supported and are finished with one read sized
+    from fstat. Newlines are normalized as in text mode.
+
+    Args:
+        file_path: Path of the file to read
+
+    Returns:
+        File content as text
+    """
+    fd = os.open(file_path, os.O_RDONLY)
+    try:
+        data: bytes | memoryview
+        if _HAS_READV:
+            buffer = _get_read_buffer()
+            data = memoryview(buffer)[: os.readv(fd, [buffer])]
+        else:
+            data = os.read(fd, _READ_CHUNK_SIZE)
+        if len(data) == _READ_CHUNK_SIZE:
+            # Large file: size the remaining read from fstat instead of chunking
+            if _HAS_FADVISE:
+                # Let the kernel read ahead for the rest of the file
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            chunks = [bytes(data)]
+            remaining = max(os.fstat(fd).st_size - len(data), 0) + 1
+            while chunk := os.read(fd, remaining):
+                chunks.append(chunk)
+            data = b"".join(chunks)
+    finally:
+        os.close(fd)
+
+    text = str(data, "utf-8")
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
 def _read_scalar_field(
     field_name: str,
     field_type: str,
-    base_path: Path,
+    base_path: str,
+    exists: bool,
 ) -> Any:
-    """Read scalar field from .txt file."""
-    file_path = base_path / f"{field_name}.txt"
+    """Read scalar field from .txt file.
+
+    Args:
+        field_name: Name of the field
+        field_type: JSON schema type of the field
+        base_path: Directory containing the field file
+        exists: Whether the directory listing contained the field file
+    """
+    file_path = os.path.join(base_path, f"{field_name}.txt")
 
-    if not file_path.exists():
+    if not exists:
         type_desc = _get_type_description(field_type)
         raise RuntimeError(
             f"Missing file: {file_path}\n"
@@ -311,7 +617,28 @@ def _read_scalar_field(
             f"Create the file with the appropriate content."
         )
 
-    content = file_path.read_text().strip()
+    return _read_primitive_file(file_path, field_type)
+
+
+def _read_primitive_file(file_path: str, field_type: str) -> Any:
+    """Read and convert the content of a scalar or array item file.
+
+    int() and float() already ignore surrounding whitespace, so numeric
+    content is converted without stripping it into a new string first.
+
+    Args:
+        file_path: Path of the file to read
+        field_type: JSON schema type of the value
+
+    Returns:
+        Converted value
+
+    Raises:
+        RuntimeError: If file content is invalid for the specified type
+    """
+    content = _read_text_file(file_path)
+    if field_type not in _WHITESPACE_TOLERANT_TYPES:
+        content = content.strip()
 
     converted = convert_primitive_value(content, field_type)
     if converted is None:
@@ -319,7 +646,7 @@ def _read_scalar_field(
         raise RuntimeError(
             f"Invalid content in file: {file_path}\n"
             f"Expected: {type_desc}\n"
-            f"Found: '{content}'\n"
+            f"Found: '{content.strip()}'\n"
             f"Fix the file content to match the expected format."
         )
 
@@ -327,8 +654,8 @@ def _read_scalar_field(
 
 
 def _read_array_of_objects(
-    array_dir: Path,
-    items_schema: dict[str, Any],
+    array_dir: str,
+    item_plans: tuple[_FieldPlan, ...],
     root_schema: dict[str, Any],
 ) -> list[dict[str, Any] | None]:
     """Read array of objects from numbered subdirectories.
@@ -337,44 +664,25 @@ def _read_array_of_objects(
 
     Args:
         array_dir: Directory containing numbered subdirectories
-        items_schema: Schema for array items
+        item_plans: Field plans shared by all array items
         root_schema: Root schema for resolving $ref
 
     Returns:
         List of parsed objects (with None for missing subdirectories)
     """
-    subdirs = [d for d in array_dir.iterdir() if d.is_dir()]
-
-    # If no subdirs, return empty array
-    if not subdirs:
-        return []
-
-    # Find highest index to determine array length
-    max_idx = -1
-    dir_map: dict[int, Path] = {}
-    for subdir in subdirs:
+    # scandir caches the entry type, so is_dir() needs no extra stat call
+    with os.scandir(array_dir) as entries:
         # Extract index from dirname (e.g., "0042" -> 42)
-        try:
-            idx = int(subdir.name)
-            dir_map[idx] = subdir
-            max_idx = max(max_idx, idx)
-        except ValueError:
-            # Skip directories that don't follow numbering pattern
-            continue
+        numbered = _index_numbered_entries((e for e in entries if e.is_dir()), "")
 
-    # Initialize array with None values
-    items: list[dict[str, Any] | None] = [None] * (max_idx + 1)
-
-    # Fill in values from existing subdirectories
-    for idx, subdir in dir_map.items():
-        item_data = read_structure_from_filesystem(items_schema, subdir, root_schema)
-        items[idx] = item_data
-
-    return items
+    # Fill in values from existing subdirectories, sharing one plan for all items
+    return _read_numbered_entries(
+        numbered, lambda subdir: _read_fields(item_plans, subdir, root_schema)
+    )
 
 
 def _read_array_of_primitives(
-    array_dir: Path,
+    array_dir: str,
     item_type: str,
 ) -> list[Any]:
     """Read array of primitives from numbered .txt files.
@@ -392,61 +700,97 @@ def _read_array_of_primitives(
     Raises:
         RuntimeError: If file content is invalid for the specified type
     """
-    files = sorted(array_dir.glob("*.txt"))
+    # scandir caches the entry type, so is_file() needs no extra stat call
+    with os.scandir(array_dir) as entries:
+        # Extract index from filename (e.g., "0042.txt" -> 42)
+        numbered = _index_numbered_entries(
+            (e for e in entries if e.name.endswith(".txt") and e.is_file()), ".txt"
+        )
 
-    # If no files, return empty array
-    if not files:
-        return []
+    # Fill in values from existing files
+    return _read_numbered_entries(
+        numbered, functools.partial(_read_primitive_file, field_type=item_type)
+    )
 
-    # Find highest index to determine array length
-    max_idx = -1
-    file_map: dict[int, Path] = {}
-    for file_path in files:
-        # Extract index from filename (e.g., "0042.txt" -> 42)
+
+def _index_numbered_entries(
+    entries: Iterable[os.DirEntry[str]], suffix: str
+) -> dict[int, os.DirEntry[str]]:
+    """Map array item entries to their index, without sorting the listing.
+
+    Args:
+        entries: Candidate entries of an array directory
+        suffix: Suffix following the number in each name ("" for directories)
+
+    Returns:
+        Mapping of item index to entry; names that are not a non-negative
+        number are skipped, and of names with the same number (e.g. "1" and
+        "0001") the greatest name wins, as it would after sorting by name
+    """
+    numbered: dict[int, os.DirEntry[str]] = {}
+    for entry in entries:
         try:
-            idx = int(file_path.stem)
-            file_map[idx] = file_path
-            max_idx = max(max_idx, idx)
+            idx = int(entry.name[: len(entry.name) - len(suffix)])
         except ValueError:
-            # Skip files that don't follow numbering pattern
+            # Skip entries that don't follow numbering pattern
             continue
+        if idx < 0:
+            continue
+        current = numbered.get(idx)
+        if current is None or entry.name > current.name:
+            numbered[idx] = entry
+    return numbered
 
-    # Initialize array with None values
-    items: list[Any] = [None] * (max_idx + 1)
 
-    # Fill in values from existing files
-    for idx, file_path in file_map.items():
-        content = file_path.read_text().strip()
+def _read_numbered_entries(
+    numbered: dict[int, os.DirEntry[str]],
+    read: Callable[[str], _T],
+) -> list[_T | None]:
+    """Read numbered array entries into a list placed by index.
 
-        converted = convert_primitive_value(content, item_type)
-        if converted is None:
-            type_desc = _get_type_description(item_type)
-            raise RuntimeError(
-                f"Invalid content in file: {file_path}\n"
-                f"Expected: {type_desc}\n"
-                f"Found: '{content}'\n"
-                f"Fix the file content to match the expected format."
-            )
+    The list is sized from the highest index and filled directly, so the
+    listing is never sorted. Reads are issued in index order.
+
+    Args:
+        numbered: Mapping of item index to entry
+        read: Function reading one entry path
+
+    Returns:
+        Items by index, with None for indices without an entry
+    """
+    # If no numbered entries, return empty array
+    if not numbered:
+        return []
+
+    # Initialize array with None values up to the highest index
+    items: list[_T | None] = [None] * (max(numbered) + 1)
 
-        items[idx] = converted
+    for idx in range(len(items)):
+        entry = numbered.get(idx)
+        if entry is not None:
+            items[idx] = read(entry.path)
 
     return items
 
 
 def _read_array_field(
-    field_name: str,
-    field_schema: dict[str, Any],
-    base_path: Path,
+    plan: _FieldPlan,
+    base_path: str,
     root_schema: dict[str, Any],
+    is_dir: bool | None,
 ) -> list[Any]:
-    """Read array field from directory with numbered files/subdirs."""
-    array_dir = base_path / field_name
+    """Read array field from directory with numbered files/subdirs.
 
-    if not array_dir.exists():
-        items_schema = field_schema.get("items", {})
-        items_schema = _resolve_schema_ref(items_schema, root_schema)
-        item_type = _get_non_null_type(items_schema) or "string"
-        if item_type == "object":
+    Args:
+        plan: Plan of the array field
+        base_path: Directory containing the array directory
+        root_schema: Root schema for resolving $ref
+        is_dir: Whether the listed entry is a directory (None if missing)
+    """
+    array_dir = os.path.join(base_path, plan.name)
+
+    if is_dir is None:
+        if plan.kind is _FieldKind.OBJECT_ARRAY:
             raise RuntimeError(
                 f"Missing directory: {array_dir}\n"
                 f"This should contain numbered subdirectories (0000/, 0001/, etc.)\n"
@@ -459,36 +803,38 @@ def _read_array_field(
                 f"Create it with: mkdir -p {array_dir}"
             )
 
-    if not array_dir.is_dir():
+    if not is_dir:
         raise RuntimeError(
             f"Expected directory but found file: {array_dir}\n"
             f"Remove the file and create a directory instead:\n"
             f"rm {array_dir} && mkdir -p {array_dir}"
         )
 
-    items_schema = field_schema.get("items", {})
-    items_schema = _resolve_schema_ref(items_schema, root_schema)
-    # Get non-null schema (handles anyOf with null)
-    items_schema_non_null = _get_non_null_schema(items_schema)
-    item_type = _get_non_null_type(items_schema) or "string"
-
-    if item_type == "object":
-        return _read_array_of_objects(array_dir, items_schema_non_null, root_schema)
+    if plan.kind is _FieldKind.OBJECT_ARRAY:
+        item_plans = _get_nested_plans(plan, root_schema)
+        return _read_array_of_objects(array_dir, item_plans, root_schema)
     else:
-        return _read_array_of_primitives(array_dir, item_type)
+        return _read_array_of_primitives(array_dir, cast(str, plan.item_type))
 
 
 def _read_object_field(
-    field_name: str,
-    field_schema: dict[str, Any],
-    base_path: Path,
+    plan: _FieldPlan,
+    base_path: str,
     root_schema: dict[str, Any],
+    is_dir: bool | None,
 ) -> dict[str, Any]:
-    """Read object field from subdirectory."""
-    object_dir = base_path / field_name
+    """Read object field from subdirectory.
 
-    if not object_dir.exists():
-        nested_props = field_schema.get("properties", {})
+    Args:
+        plan: Plan of the object field
+        base_path: Directory containing the object directory
+        root_schema: Root schema for resolving $ref
+        is_dir: Whether the listed entry is a directory (None if missing)
+    """
+    object_dir = os.path.join(base_path, plan.name)
+
+    if is_dir is None:
+        nested_props = plan.schema.get("properties", {})
         fields_list = ", ".join(nested_props.keys()) if nested_props else "nested files"
         raise RuntimeError(
             f"Missing directory: {object_dir}\n"
@@ -496,14 +842,14 @@ def _read_object_field(
             f"Create it with: mkdir -p {object_dir}"
         )
 
-    if not object_dir.is_dir():
+    if not is_dir:
         raise RuntimeError(
             f"Expected directory but found file: {object_dir}\n"
             f"Remove the file and create a directory instead:\n"
             f"rm {object_dir} && mkdir -p {object_dir}"
         )
 
-    return read_structure_from_filesystem(field_schema, object_dir, root_schema)
+    return _read_fields(_get_nested_plans(plan, root_schema), object_dir, root_schema)
 
 
 def build_structure_instructions(
@@ -523,6 +869,33 @@ def build_structure_instructions(
     Returns:
         Instruction string without JSON terminology
     """
+    template = _compile_structure_instructions(
+        json.dumps(schema), tool_name, tool_description
+    )
+    return template.replace(_TEMP_DIR_PLACEHOLDER, temp_dir)
+
+
+@functools.lru_cache(maxsize=64)
+def _compile_structure_instructions(
+    schema_key: str,
+    tool_name: str | None,
+    tool_description: str | None,
+) -> str:
+    """Render the instructions for a schema with a placeholder working directory.
+
+    Output tools and function schemas are reused across requests while the
+    working directory changes every time, so the schema walk and rendering are
+    cached and only the directory is substituted per call.
+
+    Args:
+        schema_key: JSON of the schema defining structure
+        tool_name: Optional function/tool name (for argument collection context)
+        tool_description: Optional function/tool description (for argument collection context)
+
+    Returns:
+        Instruction string containing _TEMP_DIR_PLACEHOLDER
+    """
+    schema = json.loads(schema_key)
     properties = schema.get("properties", {})
     required_fields = schema.get("required", [])
 
@@ -554,7 +927,7 @@ def build_structure_instructions(
 ## Working Directory
 
 ```bash
-mkdir -p {temp_dir}
+mkdir -p {_TEMP_DIR_PLACEHOLDER}
 ```
 
 ---
@@ -23,6 +23,36 @@ LONG_RUNTIME_THRESHOLD_SECONDS = 600  # 10 minutes threshold for long runtime wa
 MAX_CLI_RETRIES = 3  # Maximum retries for transient CLI infrastructure failures
 RETRY_BACKOFF_BASE = 2  # Exponential backoff base (seconds)
 
+# stderr substrings that indicate a transient, retryable CLI failure
+CLI_INFRASTRUCTURE_FAILURE_MARKERS = (
+    "Cannot find module",  # Node.js module loading errors (e.g., missing yoga.wasm)
+    "MODULE_NOT_FOUND",  # Node.js module resolution errors
+    "ENOENT",
+    "EACCES",
+)
+
+# Lowercase substrings of CLI error messages that indicate OAuth/auth failures
+OAUTH_ERROR_INDICATORS = (
+    "oauth token",
+    "oauth_token",
+    "/login",
+    "authentication",
+    "auth expired",
+    "auth failed",
+    "token expired",
+    "token revoked",
+    "please login",
+    "please log in",
+)
+
+# Boolean spellings and their values; unlisted strings convert to False after
+# a lowercase retry. Cased variants of the usual spellings, true and false,
+# are included so they resolve with one lookup and no lower() call.
+BOOLEAN_STRINGS: dict[str, bool] = {
+    **dict.fromkeys(("true", "True", "TRUE", "1", "yes", "Yes", "YES"), True),
+    **dict.fromkeys(("false", "False", "FALSE", "0", "no", "No", "NO"), False),
+}
+
 
 def convert_primitive_value(
     value: str, field_type: str
@@ -53,12 +83,17 @@ def convert_primitive_value(
         if field_type == "integer":
             return int(value)
         elif field_type == "number":
-            # Preserve integer vs float distinction
-            if "." in value or "e" in value.lower():
+            # Preserve integer vs float distinction; checking both exponent
+            # cases avoids building a lowercased copy of the value
+            if "." in value or "e" in value or "E" in value:
                 return float(value)
             return int(value)
         elif field_type == "boolean":
-            return value.lower() in ("true", "1", "yes")
+            # Common spellings hit the map directly; others are lowercased first
+            flag = BOOLEAN_STRINGS.get(value)
+            if flag is None:
+                flag = BOOLEAN_STRINGS.get(value.lower(), False)
+            return flag
         elif field_type == "string":
             return value
     except (ValueError, AttributeError):
@@ -308,16 +343,7 @@ def detect_cli_infrastructure_failure(stderr: str) -> bool:
     Returns:
         True if error indicates retryable infrastructure failure
     """
-    # Node.js module loading errors (e.g., missing yoga.wasm)
-    if "Cannot find module" in stderr:
-        return True
-
-    # Node.js module resolution errors
-    if "MODULE_NOT_FOUND" in stderr:
-        return True
-
-    # Other transient errors
-    return bool("ENOENT" in stderr or "EACCES" in stderr)
+    return any(marker in stderr for marker in CLI_INFRASTRUCTURE_FAILURE_MARKERS)
 
 
 def detect_oauth_error(stdout: str, stderr: str) -> tuple[bool, str | None]:
@@ -344,6 +370,12 @@ def detect_oauth_error(stdout: str, stderr: str) -> tuple[bool, str | None]:
     if not stdout:
         return False, None
 
+    # Cheap substring pre-check: skip JSON parsing when no indicator can match,
+    # which is the common case for infrastructure and generic CLI failures
+    stdout_lower = stdout.lower()
+    if not any(indicator in stdout_lower for indicator in OAUTH_ERROR_INDICATORS):
+        return False, None
+
     try:
         # Try to parse JSON from first line of stdout
         first_line = stdout.strip().split("\n")[0]
@@ -361,21 +393,7 @@ def detect_oauth_error(stdout: str, stderr: str) -> tuple[bool, str | None]:
         error_msg = response.get("error", "")
         combined_msg = f"{result_msg} {error_msg}".lower()
 
-        # OAuth token errors
-        oauth_indicators = [
-            "oauth token",
-            "oauth_token",
-            "/login",
-            "authentication",
-            "auth expired",
-            "auth failed",
-            "token expired",
-            "token revoked",
-            "please login",
-            "please log in",
-        ]
-
-        for indicator in oauth_indicators:
+        for indicator in OAUTH_ERROR_INDICATORS:
             if indicator in combined_msg:
                 # Return the actual error message from the result field
                 actual_message = result_msg or error_msg or "Authentication error"
@@ -570,8 +588,9 @@ def _get_next_call_subdirectory(base_dir: str) -> Path:
         Path to numbered subdirectory (e.g., base_dir/1/, base_dir/2/, etc.)
     """
     base_path = Path(base_dir)
-    existing_subdirs = [d for d in base_path.iterdir() if d.is_dir() and d.name.isdigit()]
-    next_num = len(existing_subdirs) + 1
+    # scandir caches the entry type, so is_dir() needs no stat per entry
+    with os.scandir(base_path) as entries:
+        next_num = sum(1 for e in entries if e.name.isdigit() and e.is_dir()) + 1
 
     subdir = base_path / str(next_num)
     subdir.mkdir(parents=True, exist_ok=True)
@@ -1173,49 +1192,6 @@ async def _execute_async_command(
         ) from None
 
 
-async def _try_async_execution_with_rate_limit_retry(
-    cmd: list[str],
-    cwd: str,
-    timeout_seconds: int,
-    retry_enabled: bool,
-    settings: ClaudeCodeSettings | None = None,
-) -> tuple[ClaudeJSONResponse | None, bool]:
-    """Try async command execution with rate limit retry.
-
-    Uses shared error classification logic to handle OAuth, rate limit,
-    infrastructure, and generic errors.
-
-    Returns:
-        Tuple of (response if successful or None, should_retry_infra)
-    """
-    while True:
-        start_time = time.time()
-        process_output = await _execute_async_command(cmd, cwd, timeout_seconds, settings)
-        elapsed = time.time() - start_time
-        stdout, stderr, returncode = process_output
-
-        # Check for errors if command failed
-        if returncode != 0:
-            stdout_text = stdout.decode() if stdout else ""
-            stderr_text = stderr.decode() if stderr else ""
-
-            # Classify error and get action (may raise exception)
-            action, wait_seconds = _classify_execution_error(
-                stdout_text, stderr_text, returncode, elapsed, retry_enabled, cwd
-            )
-
-            if action == "retry_rate_limit":
-                await asyncio.sleep(int(wait_seconds))
-                logger.info("Wait complete, retrying...")
-                continue
-            elif action == "retry_infra":
-                return None, True
-
-        # Success - process and return
-        response = _process_successful_response(stdout.decode(), settings)
-        return response, False
-
-
 async def run_claude_async(
     prompt: str,
     *,
@@ -1226,6 +1202,10 @@ async def run_claude_async(
     Automatically retries on rate limit if retry_on_rate_limit is True (default).
     Also retries on transient CLI infrastructure failures (e.g., missing modules).
 
+    Rate limit waits and infrastructure retries share a single loop: rate limit
+    waits do not count against MAX_CLI_RETRIES, infrastructure failures do and
+    back off exponentially.
+
     Args:
         prompt: The prompt to send to Claude
         settings: Optional settings for Claude Code execution
@@ -1234,7 +1214,8 @@ async def run_claude_async(
         Claude JSON response
 
     Raises:
-        subprocess.CalledProcessError: If Claude CLI fails
+        ClaudeOAuthError: If the CLI reports an authentication error
+        RuntimeError: If Claude CLI fails or infrastructure failures persist
         json.JSONDecodeError: If response is not valid JSON
     """
     retry_enabled = settings.get("retry_on_rate_limit", True) if settings else True
@@ -1243,58 +1224,57 @@ async def run_claude_async(
     cwd = _setup_working_directory_and_prompt(prompt, settings)
     cmd = build_claude_command(settings=settings, output_format="json")
 
-    # Outer retry loop for infrastructure failures
-    for attempt in range(MAX_CLI_RETRIES):
+    attempt = 0
+    while True:
+        start_time = time.time()
         try:
-            response, should_retry_infra = await _try_async_execution_with_rate_limit_retry(
-                cmd, cwd, timeout_seconds, retry_enabled, settings
+            stdout, stderr, returncode = await _execute_async_command(
+                cmd, cwd, timeout_seconds, settings
             )
-            if response:
+            if returncode == 0:
+                response = _process_successful_response(stdout.decode(), settings)
                 _save_response_debug(response, settings)
                 return response
 
-            # Infrastructure failure detected
-            if should_retry_infra and attempt < MAX_CLI_RETRIES - 1:
-                backoff_seconds = RETRY_BACKOFF_BASE ** attempt
-                logger.warning(
-                    "Claude CLI infrastructure failure detected (attempt %d/%d). "
-                    "Retrying in %d seconds...",
-                    attempt + 1,
-                    MAX_CLI_RETRIES,
-                    backoff_seconds,
-                )
-                await asyncio.sleep(backoff_seconds)
-                continue
-            elif should_retry_infra:
-                # Final attempt failed
-                logger.error(
-                    "Claude CLI infrastructure failure persisted after %d attempts",
-                    MAX_CLI_RETRIES,
-                )
-                raise RuntimeError("Claude CLI infrastructure failure persisted")
-
+            # Classify error and get action (may raise exception)
+            action, wait_seconds = _classify_execution_error(
+                stdout.decode() if stdout else "",
+                stderr.decode() if stderr else "",
+                returncode,
+                time.time() - start_time,
+                retry_enabled,
+                cwd,
+            )
         except RuntimeError as e:
-            # If this is the last attempt or not an infrastructure error, re-raise
-            if attempt >= MAX_CLI_RETRIES - 1:
+            # Only infrastructure failures with attempts left are retried
+            if attempt >= MAX_CLI_RETRIES - 1 or not detect_cli_infrastructure_failure(
+                str(e)
+            ):
                 raise
-            # Check if the error is due to infrastructure failure
-            error_str = str(e)
-            if detect_cli_infrastructure_failure(error_str):
-                backoff_seconds = RETRY_BACKOFF_BASE ** attempt
-                logger.warning(
-                    "Claude CLI infrastructure failure in execution (attempt %d/%d). "
-                    "Retrying in %d seconds...",
-                    attempt + 1,
-                    MAX_CLI_RETRIES,
-                    backoff_seconds,
-                )
-                await asyncio.sleep(backoff_seconds)
-                continue
-            # Not an infrastructure error - re-raise immediately
-            raise
+            action, wait_seconds = "retry_infra", 0.0
+
+        if action == "retry_rate_limit":
+            await asyncio.sleep(int(wait_seconds))
+            logger.info("Wait complete, retrying...")
+            continue
+
+        attempt += 1
+        if attempt >= MAX_CLI_RETRIES:
+            logger.error(
+                "Claude CLI infrastructure failure persisted after %d attempts",
+                MAX_CLI_RETRIES,
+            )
+            raise RuntimeError("Claude CLI infrastructure failure persisted")
 
-    # Should never reach here, but just in case
-    raise RuntimeError("Claude CLI failed after maximum retry attempts")
+        backoff_seconds = RETRY_BACKOFF_BASE ** (attempt - 1)
+        logger.warning(
+            "Claude CLI infrastructure failure detected (attempt %d/%d). "
+            "Retrying in %d seconds...",
+            attempt,
+            MAX_CLI_RETRIES,
+            backoff_seconds,
+        )
+        await asyncio.sleep(backoff_seconds)
 
 
 def parse_stream_json_line(line: str) -> ClaudeStreamEvent | None:
@@ -0,0 +1,46 @@
+"""Shared pytest fixtures."""
+
+import asyncio
+import time
+
+import pytest
+
+_real_asyncio_sleep = asyncio.sleep
+
+
+class AsyncClock:
+    """Fake clock recording asyncio.sleep delays without actually sleeping."""
+
+    def __init__(self) -> None:
+        """Initialize with no recorded sleeps."""
+        self.sleeps: list[float] = []
+
+    @property
+    def elapsed(self) -> float:
+        """Total virtual time spent sleeping."""
+        return sum(self.sleeps)
+
+    async def sleep(self, delay: float, result: object = None) -> object:
+        """Record the delay and yield to the event loop once."""
+        self.sleeps.append(delay)
+        await _real_asyncio_sleep(0)
+        return result
+
+
+def _blocking_sleep(_seconds: float) -> None:
+    """Fail loudly if a blocking sleep is reached from async code."""
+    raise AssertionError("blocking sleep in async path")
+
+
+@pytest.fixture
+def async_clock(monkeypatch: pytest.MonkeyPatch) -> AsyncClock:
+    """Replace asyncio.sleep with a fake clock and forbid time.sleep.
+
+    Backoff delays are recorded in ``async_clock.sleeps`` and return
+    immediately, while any call to ``time.sleep`` fails the test because it
+    would block the event loop.
+    """
+    clock = AsyncClock()
+    monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+    monkeypatch.setattr(time, "sleep", _blocking_sleep)
+    return clock
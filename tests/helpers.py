@@ -0,0 +1,25 @@
+"""Shared helpers for building structure directories in tests."""
+
+import os
+from pathlib import Path
+
+
+def write_array(array_dir: Path, items: list[str]) -> None:
+    """Create an array directory holding one numbered file per item.
+
+    Files are written with a single os.write each, skipping the text I/O
+    stack of Path.write_text().
+
+    Args:
+        array_dir: Array directory to create
+        items: Item contents, written to 0000.txt, 0001.txt, ...
+    """
+    array_dir.mkdir()
+    for i, value in enumerate(items):
+        fd = os.open(
+            array_dir / f"{i:04d}.txt", os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644
+        )
+        try:
+            os.write(fd, value.encode())
+        finally:
+            os.close(fd)
@@ -0,0 +1,96 @@
+"""Tests for the async Claude CLI retry loop."""
+
+import json
+from unittest import mock
+
+import pytest
+
+from pydantic_ai_claude_code.types import ClaudeCodeSettings
+from pydantic_ai_claude_code.utils import (
+    MAX_CLI_RETRIES,
+    RETRY_BACKOFF_BASE,
+    run_claude_async,
+)
+
+SUCCESS_STDOUT = json.dumps(
+    {"type": "result", "is_error": False, "result": "ok", "usage": {}}
+).encode()
+INFRA_FAILURE = (b"", b"Error: Cannot find module 'yoga.wasm'", 1)
+RATE_LIMIT = (b"", b"5-hour limit reached \xe2\x88\x99 resets 3PM", 1)
+ATTEMPTS_WITH_ONE_RETRY = 2  # Initial failure plus successful retry
+
+
+def _settings(tmp_path) -> ClaudeCodeSettings:
+    """Build settings that keep CLI working files inside tmp_path."""
+    return {"working_directory": str(tmp_path), "claude_cli_path": "/usr/bin/claude"}
+
+
+class TestRunAsyncWithInfrastructureRetry:
+    """Test infrastructure failure handling in run_claude_async."""
+
+    async def test_retries_then_succeeds(self, tmp_path, async_clock):
+        """Test that an infrastructure failure is retried with backoff."""
+        execute = mock.AsyncMock(side_effect=[INFRA_FAILURE, (SUCCESS_STDOUT, b"", 0)])
+
+        with mock.patch(
+            "pydantic_ai_claude_code.utils._execute_async_command", execute
+        ):
+            response = await run_claude_async("hi", settings=_settings(tmp_path))
+
+        assert response["result"] == "ok"
+        assert execute.await_count == ATTEMPTS_WITH_ONE_RETRY
+        assert async_clock.sleeps == [1]
+
+    async def test_max_retries_exceeded(self, tmp_path, async_clock):
+        """Test that persistent infrastructure failures raise after MAX_CLI_RETRIES."""
+        execute = mock.AsyncMock(return_value=INFRA_FAILURE)
+
+        with (
+            mock.patch(
+                "pydantic_ai_claude_code.utils._execute_async_command", execute
+            ),
+            pytest.raises(RuntimeError, match="infrastructure failure persisted"),
+        ):
+            await run_claude_async("hi", settings=_settings(tmp_path))
+
+        assert execute.await_count == MAX_CLI_RETRIES
+        # Exponential backoff between attempts, none after the final one
+        assert async_clock.sleeps == [
+            RETRY_BACKOFF_BASE**attempt for attempt in range(MAX_CLI_RETRIES - 1)
+        ]
+
+    async def test_infrastructure_error_raised_mid_attempt_is_retried(
+        self, tmp_path, async_clock
+    ):
+        """Test that a RuntimeError carrying an infra marker is retried."""
+        execute = mock.AsyncMock(
+            side_effect=[
+                RuntimeError("spawn failed: ENOENT"),
+                (SUCCESS_STDOUT, b"", 0),
+            ]
+        )
+
+        with mock.patch(
+            "pydantic_ai_claude_code.utils._execute_async_command", execute
+        ):
+            response = await run_claude_async("hi", settings=_settings(tmp_path))
+
+        assert response["result"] == "ok"
+        assert async_clock.sleeps == [1]
+
+    async def test_rate_limit_wait_does_not_consume_attempts(
+        self, tmp_path, async_clock
+    ):
+        """Test that rate limit waits are not counted as infrastructure retries."""
+        execute = mock.AsyncMock(
+            side_effect=[RATE_LIMIT] * MAX_CLI_RETRIES + [(SUCCESS_STDOUT, b"", 0)]
+        )
+
+        with mock.patch(
+            "pydantic_ai_claude_code.utils._execute_async_command", execute
+        ):
+            response = await run_claude_async("hi", settings=_settings(tmp_path))
+
+        assert response["result"] == "ok"
+        assert execute.await_count == MAX_CLI_RETRIES + 1
+        assert len(async_clock.sleeps) == MAX_CLI_RETRIES
@@ -1,6 +1,5 @@
 """Basic integration tests for Claude Code model."""
 
-import pytest
 from pydantic import BaseModel
 from pydantic_ai import Agent
 
@@ -25,7 +24,6 @@ def test_basic_query_sync():
     assert "4" in str(result.output)
 
 
-@pytest.mark.asyncio
 async def test_basic_query_async():
     """Test basic asynchronous query using string format."""
     agent = Agent("claude-code:sonnet")
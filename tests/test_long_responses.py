@@ -1,6 +1,5 @@
 """Tests for long response handling with gradual file building."""
 
-import tempfile
 from pathlib import Path
 
 import pytest
@@ -8,6 +7,8 @@ import pytest
 from pydantic_ai_claude_code.model import ClaudeCodeModel
 from pydantic_ai_claude_code.structure_converter import read_structure_from_filesystem
 
+from .helpers import write_array
+
 # Test constants
 LARGE_ARRAY_SIZE = 100  # Number of items for large array tests
 
@@ -15,179 +16,152 @@ LARGE_ARRAY_SIZE = 100  # Number of items for large array tests
 class TestJSONAssembly:
     """Test JSON assembly from directory structure."""
 
-    def test_assemble_scalar_fields(self):
+    def test_assemble_scalar_fields(self, tmp_path):
         """Test assembling JSON with scalar fields."""
         ClaudeCodeModel()
 
-        # Create temp directory structure
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Create field files
-            (tmp_path / "name.txt").write_text("Alice")
-            (tmp_path / "age.txt").write_text("30")
-            (tmp_path / "score.txt").write_text("95.5")
-            (tmp_path / "active.txt").write_text("true")
-            (tmp_path / ".complete").touch()
+        # Create field files
+        (tmp_path / "name.txt").write_text("Alice")
+        (tmp_path / "age.txt").write_text("30")
+        (tmp_path / "score.txt").write_text("95.5")
+        (tmp_path / "active.txt").write_text("true")
+        (tmp_path / ".complete").touch()
 
-            # Schema
-            schema = {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "age": {"type": "integer"},
-                    "score": {"type": "number"},
-                    "active": {"type": "boolean"},
-                },
-            }
+        # Schema
+        schema = {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "age": {"type": "integer"},
+                "score": {"type": "number"},
+                "active": {"type": "boolean"},
+            },
+        }
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
 
-            assert result == {
-                "name": "Alice",
-                "age": 30,
-                "score": 95.5,
-                "active": True,
-            }
+        assert result == {
+            "name": "Alice",
+            "age": 30,
+            "score": 95.5,
+            "active": True,
+        }
 
-    def test_assemble_array_field(self):
+    def test_assemble_array_field(self, tmp_path):
         """Test assembling JSON with array fields."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Create array directory
-            array_dir = tmp_path / "items"
-            array_dir.mkdir()
-
-            # Create numbered files
-            (array_dir / "0000.txt").write_text("first")
-            (array_dir / "0001.txt").write_text("second")
-            (array_dir / "0002.txt").write_text("third")
-            (tmp_path / ".complete").touch()
+        # Create array directory
+        # Create numbered files
+        write_array(tmp_path / "items", ["first", "second", "third"])
+        (tmp_path / ".complete").touch()
 
-            # Schema
-            schema = {
-                "type": "object",
-                "properties": {"items": {"type": "array"}},
-            }
+        # Schema
+        schema = {
+            "type": "object",
+            "properties": {"items": {"type": "array"}},
+        }
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
 
-            assert result == {"items": ["first", "second", "third"]}
+        assert result == {"items": ["first", "second", "third"]}
 
-    def test_assemble_mixed_fields(self):
+    def test_assemble_mixed_fields(self, tmp_path):
         """Test assembling JSON with both scalar and array fields."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
+        # Create scalar fields
+        (tmp_path / "title.txt").write_text("My Report")
+        (tmp_path / "count.txt").write_text("42")
 
-            # Create scalar fields
-            (tmp_path / "title.txt").write_text("My Report")
-            (tmp_path / "count.txt").write_text("42")
-
-            # Create array field
-            tags_dir = tmp_path / "tags"
-            tags_dir.mkdir()
-            (tags_dir / "0000.txt").write_text("python")
-            (tags_dir / "0001.txt").write_text("ai")
-            (tags_dir / "0002.txt").write_text("testing")
-            (tmp_path / ".complete").touch()
+        # Create array field
+        write_array(tmp_path / "tags", ["python", "ai", "testing"])
+        (tmp_path / ".complete").touch()
 
-            # Schema
-            schema = {
-                "type": "object",
-                "properties": {
-                    "title": {"type": "string"},
-                    "count": {"type": "integer"},
-                    "tags": {"type": "array"},
-                },
-            }
+        # Schema
+        schema = {
+            "type": "object",
+            "properties": {
+                "title": {"type": "string"},
+                "count": {"type": "integer"},
+                "tags": {"type": "array"},
+            },
+        }
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
 
-            assert result == {
-                "title": "My Report",
-                "count": 42,
-                "tags": ["python", "ai", "testing"],
-            }
+        assert result == {
+            "title": "My Report",
+            "count": 42,
+            "tags": ["python", "ai", "testing"],
+        }
 
-    def test_assemble_with_multiline_content(self):
+    def test_assemble_with_multiline_content(self, tmp_path):
         """Test assembling JSON with multiline field content."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Create field with multiline content
-            (tmp_path / "description.txt").write_text(
-                "This is line 1\nThis is line 2\nThis is line 3"
-            )
-            (tmp_path / ".complete").touch()
+        # Create field with multiline content
+        (tmp_path / "description.txt").write_text(
+            "This is line 1\nThis is line 2\nThis is line 3"
+        )
+        (tmp_path / ".complete").touch()
 
-            # Schema
-            schema = {
-                "type": "object",
-                "properties": {"description": {"type": "string"}},
-            }
+        # Schema
+        schema = {
+            "type": "object",
+            "properties": {"description": {"type": "string"}},
+        }
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
 
-            assert (
-                result["description"]
-                == "This is line 1\nThis is line 2\nThis is line 3"
-            )
+        assert (
+            result["description"]
+            == "This is line 1\nThis is line 2\nThis is line 3"
+        )
 
-    def test_assemble_array_sorting(self):
+    def test_assemble_array_sorting(self, tmp_path):
         """Test that array items are sorted correctly by filename."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Create array directory with files in non-sequential order
-            array_dir = tmp_path / "items"
-            array_dir.mkdir()
-
-            # Write files out of order
-            (array_dir / "0005.txt").write_text("sixth")
-            (array_dir / "0000.txt").write_text("first")
-            (array_dir / "0003.txt").write_text("fourth")
-            (array_dir / "0001.txt").write_text("second")
-            (array_dir / "0004.txt").write_text("fifth")
-            (array_dir / "0002.txt").write_text("third")
-            (tmp_path / ".complete").touch()
-
-            # Schema
-            schema = {
-                "type": "object",
-                "properties": {"items": {"type": "array"}},
-            }
+        # Create array directory with files in non-sequential order
+        array_dir = tmp_path / "items"
+        array_dir.mkdir()
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Write files out of order
+        (array_dir / "0005.txt").write_text("sixth")
+        (array_dir / "0000.txt").write_text("first")
+        (array_dir / "0003.txt").write_text("fourth")
+        (array_dir / "0001.txt").write_text("second")
+        (array_dir / "0004.txt").write_text("fifth")
+        (array_dir / "0002.txt").write_text("third")
+        (tmp_path / ".complete").touch()
 
-            # Should be sorted by filename
-            assert result["items"] == [
-                "first",
-                "second",
-                "third",
-                "fourth",
-                "fifth",
-                "sixth",
-            ]
+        # Schema
+        schema = {
+            "type": "object",
+            "properties": {"items": {"type": "array"}},
+        }
 
-    def test_assemble_boolean_variations(self):
-        """Test different boolean value formats."""
-        ClaudeCodeModel()
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
+
+        # Should be sorted by filename
+        assert result["items"] == [
+            "first",
+            "second",
+            "third",
+            "fourth",
+            "fifth",
+            "sixth",
+        ]
 
-        test_cases = [
+    @pytest.mark.parametrize(
+        ("input_val", "expected"),
+        [
             ("true", True),
             ("True", True),
             ("TRUE", True),
@@ -198,114 +172,101 @@ class TestJSONAssembly:
             ("FALSE", False),
             ("0", False),
             ("no", False),
-        ]
+        ],
+    )
+    def test_assemble_boolean_variations(self, tmp_path, input_val, expected):
+        """Test different boolean value formats."""
+        ClaudeCodeModel()
 
-        for input_val, expected in test_cases:
-            with tempfile.TemporaryDirectory() as tmpdir:
-                tmp_path = Path(tmpdir)
-                (tmp_path / "flag.txt").write_text(input_val)
-                (tmp_path / ".complete").touch()
+        (tmp_path / "flag.txt").write_text(input_val)
+        (tmp_path / ".complete").touch()
 
-                schema = {
-                    "type": "object",
-                    "properties": {"flag": {"type": "boolean"}},
-                }
+        schema = {
+            "type": "object",
+            "properties": {"flag": {"type": "boolean"}},
+        }
 
-                result = read_structure_from_filesystem(schema, tmp_path)
-                assert result["flag"] == expected, f"Failed for input: {input_val}"
+        result = read_structure_from_filesystem(schema, tmp_path)
+        assert result["flag"] is expected
 
-    def test_assemble_missing_field_error(self):
+    def test_assemble_missing_field_error(self, tmp_path):
         """Test error when required field is missing."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Only create one field, but schema expects two
-            (tmp_path / "name.txt").write_text("Alice")
-            (tmp_path / ".complete").touch()
+        # Only create one field, but schema expects two
+        (tmp_path / "name.txt").write_text("Alice")
+        (tmp_path / ".complete").touch()
 
-            schema = {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "age": {"type": "integer"},  # Missing!
-                },
-                "required": ["name", "age"],  # Both are required
-            }
+        schema = {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "age": {"type": "integer"},  # Missing!
+            },
+            "required": ["name", "age"],  # Both are required
+        }
 
-            # Should raise RuntimeError
-            with pytest.raises(RuntimeError, match="Missing file:"):
-                read_structure_from_filesystem(schema, tmp_path)
+        # Should raise RuntimeError
+        with pytest.raises(RuntimeError, match="Missing file:"):
+            read_structure_from_filesystem(schema, tmp_path)
 
-    def test_assemble_missing_array_directory_error(self):
+    def test_assemble_missing_array_directory_error(self, tmp_path):
         """Test error when array directory is missing."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Don't create the array directory
-            (tmp_path / ".complete").touch()
+        # Don't create the array directory
+        (tmp_path / ".complete").touch()
 
-            schema = {
-                "type": "object",
-                "properties": {"items": {"type": "array"}},
-                "required": ["items"],  # items is required
-            }
+        schema = {
+            "type": "object",
+            "properties": {"items": {"type": "array"}},
+            "required": ["items"],  # items is required
+        }
 
-            # Should raise RuntimeError
-            with pytest.raises(RuntimeError, match="Missing directory:"):
-                read_structure_from_filesystem(schema, tmp_path)
+        # Should raise RuntimeError
+        with pytest.raises(RuntimeError, match="Missing directory:"):
+            read_structure_from_filesystem(schema, tmp_path)
 
-    def test_assemble_empty_array(self):
+    def test_assemble_empty_array(self, tmp_path):
         """Test assembling an empty array."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Create empty array directory
-            array_dir = tmp_path / "items"
-            array_dir.mkdir()
-            (tmp_path / ".complete").touch()
+        # Create empty array directory
+        array_dir = tmp_path / "items"
+        array_dir.mkdir()
+        (tmp_path / ".complete").touch()
 
-            schema = {
-                "type": "object",
-                "properties": {"items": {"type": "array"}},
-            }
+        schema = {
+            "type": "object",
+            "properties": {"items": {"type": "array"}},
+        }
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
 
-            assert result == {"items": []}
+        assert result == {"items": []}
 
-    def test_assemble_large_array(self):
+    def test_assemble_large_array(self, tmp_path):
         """Test assembling a large array with many items."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Create array directory with 100 items
-            array_dir = tmp_path / "items"
-            array_dir.mkdir()
-
-            for i in range(LARGE_ARRAY_SIZE):
-                (array_dir / f"{i:04d}.txt").write_text(f"item_{i}")
-            (tmp_path / ".complete").touch()
+        # Create array directory with 100 items
+        write_array(
+            tmp_path / "items", [f"item_{i}" for i in range(LARGE_ARRAY_SIZE)]
+        )
+        (tmp_path / ".complete").touch()
 
-            schema = {
-                "type": "object",
-                "properties": {"items": {"type": "array"}},
-            }
+        schema = {
+            "type": "object",
+            "properties": {"items": {"type": "array"}},
+        }
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
 
-            assert len(result["items"]) == LARGE_ARRAY_SIZE
-            assert result["items"][0] == "item_0"
-            assert result["items"][LARGE_ARRAY_SIZE - 1] == f"item_{LARGE_ARRAY_SIZE - 1}"
+        assert len(result["items"]) == LARGE_ARRAY_SIZE
+        assert result["items"][0] == "item_0"
+        assert result["items"][LARGE_ARRAY_SIZE - 1] == f"item_{LARGE_ARRAY_SIZE - 1}"
 
     def _create_recommendation_item(
         self, array_dir: Path, item_num: str, priority: int, data: tuple[list[str], str, str]
@@ -323,10 +284,7 @@ class TestJSONAssembly:
         item_dir.mkdir()
         (item_dir / "priority.txt").write_text(str(priority))
 
-        criteria_dir = item_dir / "criteria_addressed"
-        criteria_dir.mkdir()
-        for i, criterion in enumerate(criteria):
-            (criteria_dir / f"{i:04d}.txt").write_text(criterion)
+        write_array(item_dir / "criteria_addressed", criteria)
 
         (item_dir / "current_weakness.txt").write_text(weakness)
         (item_dir / "specific_action.txt").write_text(action)
@@ -351,7 +309,7 @@ class TestJSONAssembly:
 
         (tmp_path / ".complete").touch()
 
-    def test_assemble_array_with_object_items(self):
+    def test_assemble_array_with_object_items(self, tmp_path):
         """Test assembling array with nested objects (e.g., list[BaseModel])."""
         ClaudeCodeModel()
 
@@ -361,151 +319,127 @@ class TestJSONAssembly:
         priority_2 = 2
         priority_3 = 3
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            self._create_recommendation_filesystem(tmp_path, priority_1, priority_2, priority_3)
-
-            # Schema matching ImprovementRecommendation from the bug report
-            schema = {
-                "type": "object",
-                "properties": {
-                    "recommendations": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "priority": {"type": "integer"},
-                                "criteria_addressed": {"type": "array"},
-                                "current_weakness": {"type": "string"},
-                                "specific_action": {"type": "string"},
-                            },
+        self._create_recommendation_filesystem(tmp_path, priority_1, priority_2, priority_3)
+
+        # Schema matching ImprovementRecommendation from the bug report
+        schema = {
+            "type": "object",
+            "properties": {
+                "recommendations": {
+                    "type": "array",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "priority": {"type": "integer"},
+                            "criteria_addressed": {"type": "array"},
+                            "current_weakness": {"type": "string"},
+                            "specific_action": {"type": "string"},
                         },
-                    }
-                },
-            }
+                    },
+                }
+            },
+        }
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
 
-            # Verify structure
-            assert "recommendations" in result
-            assert len(result["recommendations"]) == expected_num_items
+        # Verify structure
+        assert "recommendations" in result
+        assert len(result["recommendations"]) == expected_num_items
 
-            # Verify first item is a dict (not a string!)
-            assert isinstance(result["recommendations"][0], dict)
-            assert result["recommendations"][0]["priority"] == priority_1
-            assert isinstance(result["recommendations"][0]["criteria_addressed"], list)
-            assert result["recommendations"][0]["criteria_addressed"] == ["clarity", "impact"]
-            assert result["recommendations"][0]["current_weakness"] == "Lacks detail"
-            assert result["recommendations"][0]["specific_action"] == "Add examples"
+        # Verify first item is a dict (not a string!)
+        assert isinstance(result["recommendations"][0], dict)
+        assert result["recommendations"][0]["priority"] == priority_1
+        assert isinstance(result["recommendations"][0]["criteria_addressed"], list)
+        assert result["recommendations"][0]["criteria_addressed"] == ["clarity", "impact"]
+        assert result["recommendations"][0]["current_weakness"] == "Lacks detail"
+        assert result["recommendations"][0]["specific_action"] == "Add examples"
 
-            # Verify second item
-            assert isinstance(result["recommendations"][1], dict)
-            assert result["recommendations"][1]["priority"] == priority_2
+        # Verify second item
+        assert isinstance(result["recommendations"][1], dict)
+        assert result["recommendations"][1]["priority"] == priority_2
 
-            # Verify third item
-            assert isinstance(result["recommendations"][2], dict)
-            assert result["recommendations"][2]["priority"] == priority_3
+        # Verify third item
+        assert isinstance(result["recommendations"][2], dict)
+        assert result["recommendations"][2]["priority"] == priority_3
 
-    def test_assemble_array_with_integer_items(self):
+    def test_assemble_array_with_integer_items(self, tmp_path):
         """Test assembling array with integer items."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Create array directory with integer items
-            array_dir = tmp_path / "scores"
-            array_dir.mkdir()
-
-            (array_dir / "0000.txt").write_text("95")
-            (array_dir / "0001.txt").write_text("87")
-            (array_dir / "0002.txt").write_text("92")
-            (tmp_path / ".complete").touch()
+        # Create array directory with integer items
+        array_dir = tmp_path / "scores"
+        write_array(array_dir, ["95", "87", "92"])
+        (tmp_path / ".complete").touch()
 
-            schema = {
-                "type": "object",
-                "properties": {
-                    "scores": {
-                        "type": "array",
-                        "items": {"type": "integer"},
-                    }
-                },
-            }
+        schema = {
+            "type": "object",
+            "properties": {
+                "scores": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                }
+            },
+        }
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
 
-            assert result == {"scores": [95, 87, 92]}
-            # Verify types
-            assert all(isinstance(x, int) for x in result["scores"])
+        assert result == {"scores": [95, 87, 92]}
+        # Verify types
+        assert all(isinstance(x, int) for x in result["scores"])
 
-    def test_assemble_array_with_number_items(self):
+    def test_assemble_array_with_number_items(self, tmp_path):
         """Test assembling array with float items."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Create array directory with float items
-            array_dir = tmp_path / "temperatures"
-            array_dir.mkdir()
-
-            (array_dir / "0000.txt").write_text("98.6")
-            (array_dir / "0001.txt").write_text("99.2")
-            (array_dir / "0002.txt").write_text("97.8")
-            (tmp_path / ".complete").touch()
+        # Create array directory with float items
+        array_dir = tmp_path / "temperatures"
+        write_array(array_dir, ["98.6", "99.2", "97.8"])
+        (tmp_path / ".complete").touch()
 
-            schema = {
-                "type": "object",
-                "properties": {
-                    "temperatures": {
-                        "type": "array",
-                        "items": {"type": "number"},
-                    }
-                },
-            }
+        schema = {
+            "type": "object",
+            "properties": {
+                "temperatures": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                }
+            },
+        }
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
 
-            assert result == {"temperatures": [98.6, 99.2, 97.8]}
-            # Verify types
-            assert all(isinstance(x, float) for x in result["temperatures"])
+        assert result == {"temperatures": [98.6, 99.2, 97.8]}
+        # Verify types
+        assert all(isinstance(x, float) for x in result["temperatures"])
 
-    def test_assemble_array_with_boolean_items(self):
+    def test_assemble_array_with_boolean_items(self, tmp_path):
         """Test assembling array with boolean items."""
         ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Create array directory with boolean items
-            array_dir = tmp_path / "flags"
-            array_dir.mkdir()
-
-            (array_dir / "0000.txt").write_text("true")
-            (array_dir / "0001.txt").write_text("false")
-            (array_dir / "0002.txt").write_text("1")
-            (array_dir / "0003.txt").write_text("0")
-            (tmp_path / ".complete").touch()
+        # Create array directory with boolean items
+        array_dir = tmp_path / "flags"
+        write_array(array_dir, ["true", "false", "1", "0"])
+        (tmp_path / ".complete").touch()
 
-            schema = {
-                "type": "object",
-                "properties": {
-                    "flags": {
-                        "type": "array",
-                        "items": {"type": "boolean"},
-                    }
-                },
-            }
+        schema = {
+            "type": "object",
+            "properties": {
+                "flags": {
+                    "type": "array",
+                    "items": {"type": "boolean"},
+                }
+            },
+        }
 
-            # Assemble
-            result = read_structure_from_filesystem(schema, tmp_path)
+        # Assemble
+        result = read_structure_from_filesystem(schema, tmp_path)
 
-            assert result == {"flags": [True, False, True, False]}
-            # Verify types
-            assert all(isinstance(x, bool) for x in result["flags"])
+        assert result == {"flags": [True, False, True, False]}
+        # Verify types
+        assert all(isinstance(x, bool) for x in result["flags"])
 
     def test_structured_output_instruction_format(self):
         """Test that structured output instruction includes correct format."""
@@ -560,75 +494,137 @@ class TestJSONAssembly:
 class TestValidationErrors:
     """Test validation error handling for assembled JSON."""
 
-    def test_type_mismatch_in_assembled_json(self):
+    def test_type_mismatch_in_assembled_json(self, tmp_path):
         """Test that type mismatches are caught and reported."""
         model = ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-
-            # Create fields with wrong types
-            (tmp_path / "name.txt").write_text("Alice")
-            (tmp_path / "age.txt").write_text("not_a_number")  # Should be integer!
-            (tmp_path / ".complete").touch()
+        # Create fields with wrong types
+        (tmp_path / "name.txt").write_text("Alice")
+        (tmp_path / "age.txt").write_text("not_a_number")  # Should be integer!
+        (tmp_path / ".complete").touch()
 
-            schema = {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "age": {"type": "integer"},
-                },
-                "required": ["name", "age"],
-            }
+        schema = {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "age": {"type": "integer"},
+            },
+            "required": ["name", "age"],
+        }
 
-            from pydantic_ai_claude_code.types import ClaudeCodeSettings
+        from pydantic_ai_claude_code.types import ClaudeCodeSettings
 
-            settings: ClaudeCodeSettings = {"__temp_json_dir": str(tmp_path)}
+        settings: ClaudeCodeSettings = {"__temp_json_dir": str(tmp_path)}
 
-            # Read and validate - should catch type error
-            parsed_data, error_msg = model._read_structured_output_file(
-                "/tmp/dummy.json", schema, settings
-            )
+        # Read and validate - should catch type error
+        parsed_data, error_msg = model._read_structured_output_file(
+            "/tmp/dummy.json", schema, settings
+        )
 
-            assert parsed_data is None
-            assert error_msg is not None
-            assert "type" in error_msg.lower() or "invalid" in error_msg.lower()
+        assert parsed_data is None
+        assert error_msg is not None
+        assert "type" in error_msg.lower() or "invalid" in error_msg.lower()
 
-    def test_missing_required_field_validation(self):
+    def test_missing_required_field_validation(self, tmp_path):
         """Test that missing required fields are caught."""
         model = ClaudeCodeModel()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
+        # Only create one field, schema requires two
+        (tmp_path / "name.txt").write_text("Alice")
+        # Missing: age.txt
+        (tmp_path / ".complete").touch()
 
-            # Only create one field, schema requires two
-            (tmp_path / "name.txt").write_text("Alice")
-            # Missing: age.txt
-            (tmp_path / ".complete").touch()
+        schema = {
+            "type": "object",
+            "properties": {
+                "name": {"type": "string"},
+                "age": {"type": "integer"},
+            },
+            "required": ["name", "age"],
+        }
 
-            schema = {
-                "type": "object",
-                "properties": {
-                    "name": {"type": "string"},
-                    "age": {"type": "integer"},
-                },
-                "required": ["name", "age"],
-            }
+        from pydantic_ai_claude_code.types import ClaudeCodeSettings
 
-            from pydantic_ai_claude_code.types import ClaudeCodeSettings
+        settings: ClaudeCodeSettings = {"__temp_json_dir": str(tmp_path)}
 
-            settings: ClaudeCodeSettings = {"__temp_json_dir": str(tmp_path)}
+        # Should catch missing field during assembly
+        parsed_data, error_msg = model._read_structured_output_file(
+            "/tmp/dummy.json", schema, settings
+        )
+
+        assert parsed_data is None
+        assert error_msg is not None
+        assert "missing" in error_msg.lower() or "age" in error_msg.lower()
+
+    def test_invalid_array_item_aborts_assembly(self, tmp_path):
+        """Test that the first invalid array item stops assembly with its path."""
+        model = ClaudeCodeModel()
+
+        write_array(tmp_path / "scores", ["95", "oops", "also_bad", "92"])
+
+        schema = {
+            "type": "object",
+            "properties": {"scores": {"type": "array", "items": {"type": "integer"}}},
+            "required": ["scores"],
+        }
+
+        from pydantic_ai_claude_code.types import ClaudeCodeSettings
 
-            # Should catch missing field during assembly
-            parsed_data, error_msg = model._read_structured_output_file(
-                "/tmp/dummy.json", schema, settings
-            )
+        settings: ClaudeCodeSettings = {"__temp_json_dir": str(tmp_path)}
 
-            assert parsed_data is None
-            assert error_msg is not None
-            assert "missing" in error_msg.lower() or "age" in error_msg.lower()
+        parsed_data, error_msg = model._read_structured_output_file(
+            "/tmp/dummy.json", schema, settings
+        )
+
+        assert parsed_data is None
+        assert error_msg is not None
+        assert "0001.txt" in error_msg
+        assert "'oops'" in error_msg
+        assert "also_bad" not in error_msg
 
-    def test_validation_error_returns_as_text(self):
+    def test_json_file_validation_errors(self, tmp_path):
+        """Test that JSON file validation reports missing fields and wrong types."""
+        model = ClaudeCodeModel()
+        schema = {
+            "type": "object",
+            "properties": {"name": {"type": "string"}, "age": {"type": "integer"}},
+            "required": ["name"],
+        }
+        output_file = tmp_path / "output.json"
+
+        output_file.write_text('{"age": 30}')
+        _, missing_error = model._try_read_json_file(str(output_file), schema)
+        output_file.write_text('{"name": "Alice", "age": "30"}')
+        _, type_error = model._try_read_json_file(str(output_file), schema)
+        output_file.write_text('{"name": "Alice", "age": 30}')
+        parsed_data, no_error = model._try_read_json_file(str(output_file), schema)
+
+        assert missing_error is not None
+        assert missing_error.startswith("Please provide: name")
+        assert type_error is not None
+        assert "'age' should be a integer, but it's a str" in type_error
+        assert parsed_data == {"name": "Alice", "age": 30}
+        assert no_error is None
+
+    def test_json_file_missing_or_malformed(self, tmp_path):
+        """Test reading a missing, malformed, or non-UTF-8 structured output file."""
+        model = ClaudeCodeModel()
+        schema = {"type": "object", "properties": {"value": {"type": "integer"}}}
+        output_file = tmp_path / "output.json"
+
+        missing = model._try_read_json_file(str(output_file), schema)
+        output_file.write_text('{"value": 1')
+        _, malformed_error = model._try_read_json_file(str(output_file), schema)
+        output_file.write_bytes(b'{"value": "\xff"}')
+        _, encoding_error = model._try_read_json_file(str(output_file), schema)
+
+        assert missing == (None, None)
+        assert malformed_error is not None
+        assert malformed_error.endswith('File content:\n{"value": 1')
+        assert encoding_error is not None
+        assert "isn't formatted correctly" in encoding_error
+
+    def test_validation_error_returns_as_text(self, tmp_path):
         """Test that validation errors are returned as TextPart for retry."""
         model = ClaudeCodeModel()
 
@@ -652,27 +648,25 @@ class TestValidationErrors:
             }
 
         # Test with a file that will fail validation
-        with tempfile.TemporaryDirectory() as tmpdir:
-            tmp_path = Path(tmpdir)
-            output_file = tmp_path / "output.json"
-            output_file.write_text('{"value": "not_an_int"}')  # Invalid!
+        output_file = tmp_path / "output.json"
+        output_file.write_text('{"value": "not_an_int"}')  # Invalid!
 
-            from pydantic_ai_claude_code.types import ClaudeCodeSettings
+        from pydantic_ai_claude_code.types import ClaudeCodeSettings
 
-            settings: ClaudeCodeSettings = {
-                "__structured_output_file": str(output_file)
-            }
+        settings: ClaudeCodeSettings = {
+            "__structured_output_file": str(output_file)
+        }
 
-            result = model._convert_response(
-                response, output_tools=[MockOutputTool()], settings=settings
-            )
+        result = model._convert_response(
+            response, output_tools=[MockOutputTool()], settings=settings
+        )
 
-            # Should return TextPart with error message
-            assert len(result.parts) == 1
-            from pydantic_ai.messages import TextPart
+        # Should return TextPart with error message
+        assert len(result.parts) == 1
+        from pydantic_ai.messages import TextPart
 
-            assert isinstance(result.parts[0], TextPart)
-            # Error message should mention the type issue
-            error_text = result.parts[0].content
-            assert "value" in error_text.lower()
-            assert "type" in error_text.lower() or "int" in error_text.lower()
+        assert isinstance(result.parts[0], TextPart)
+        # Error message should mention the type issue
+        error_text = result.parts[0].content
+        assert "value" in error_text.lower()
+        assert "type" in error_text.lower() or "int" in error_text.lower()
@@ -1,7 +1,5 @@
 """Tests for message formatting and conversion."""
 
-import tempfile
-
 from pydantic_ai.messages import (
     ModelMessage,
     ModelRequest,
@@ -23,7 +21,7 @@ EXPECTED_TOTAL_MESSAGES = 4  # Total messages in full conversation test
 EXPECTED_ASSISTANT_MESSAGES = 2  # Number of assistant messages in full conversation test
 
 
-def test_format_system_prompt():
+def test_format_system_prompt(tmp_path):
     """Test that system prompt is prepended."""
     messages: list[ModelMessage] = [
         ModelRequest(
@@ -34,16 +32,15 @@ def test_format_system_prompt():
         ),
     ]
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        formatted = format_messages_for_claude(messages, working_dir=tmpdir)
+    formatted = format_messages_for_claude(messages, working_dir=str(tmp_path))
 
-        assert "System: You are a helpful assistant." in formatted
-        assert "Request: What is 2+2?" in formatted
-        # System should come before Request
-        assert formatted.index("System:") < formatted.index("Request:")
+    assert "System: You are a helpful assistant." in formatted
+    assert "Request: What is 2+2?" in formatted
+    # System should come before Request
+    assert formatted.index("System:") < formatted.index("Request:")
 
 
-def test_format_conversation():
+def test_format_conversation(tmp_path):
     """Test formatting a multi-turn conversation."""
     messages: list[ModelMessage] = [
         ModelRequest(parts=[UserPromptPart(content="What is 2+2?")]),
@@ -51,15 +48,14 @@ def test_format_conversation():
         ModelRequest(parts=[UserPromptPart(content="What about 3+3?")]),
     ]
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        formatted = format_messages_for_claude(messages, working_dir=tmpdir)
+    formatted = format_messages_for_claude(messages, working_dir=str(tmp_path))
 
-        assert "Request: What is 2+2?" in formatted
-        assert "Assistant: 4" in formatted
-        assert "Request: What about 3+3?" in formatted
+    assert "Request: What is 2+2?" in formatted
+    assert "Assistant: 4" in formatted
+    assert "Request: What about 3+3?" in formatted
 
 
-def test_format_tool_call():
+def test_format_tool_call(tmp_path):
     """Test formatting tool calls - tool calls are skipped in history."""
     messages: list[ModelMessage] = [
         ModelResponse(
@@ -73,15 +69,14 @@ def test_format_tool_call():
         ),
     ]
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        formatted = format_messages_for_claude(messages, working_dir=tmpdir)
+    formatted = format_messages_for_claude(messages, working_dir=str(tmp_path))
 
-        # Tool calls are not included in conversation history
-        # (only tool results are shown as "Context: ...")
-        assert "calculator" not in formatted or formatted == ""
+    # Tool calls are not included in conversation history
+    # (only tool results are shown as "Context: ...")
+    assert "calculator" not in formatted or formatted == ""
 
 
-def test_format_tool_return():
+def test_format_tool_return(tmp_path):
     """Test formatting tool returns - results should be written to files."""
     messages: list[ModelMessage] = [
         ModelRequest(
@@ -95,18 +90,16 @@ def test_format_tool_return():
         ),
     ]
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        formatted = format_messages_for_claude(messages, working_dir=tmpdir)
+    formatted = format_messages_for_claude(messages, working_dir=str(tmp_path))
 
-        # Should reference the file instead of embedding content
-        assert "tool_result_1_calculator.txt" in formatted
-        assert "Additional Information" in formatted
-        assert "calculator tool" in formatted
+    # Should reference the file instead of embedding content
+    assert "tool_result_1_calculator.txt" in formatted
+    assert "Additional Information" in formatted
+    assert "calculator tool" in formatted
 
-        # Verify file was created in working directory
-        tool_file = f"{tmpdir}/tool_result_1_calculator.txt"
-        with open(tool_file, encoding="utf-8") as f:
-            assert f.read() == "4"
+    # Verify file was created in working directory
+    tool_file = tmp_path / "tool_result_1_calculator.txt"
+    assert tool_file.read_text(encoding="utf-8") == "4"
 
 
 def test_build_conversation_context_empty():
@@ -0,0 +1,190 @@
+"""Tests for ClaudeCodeStreamedResponse background consumption."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+from pydantic_ai.messages import FinalResultEvent, PartDeltaEvent, PartStartEvent
+from pydantic_ai.models import ModelRequestParameters
+
+from pydantic_ai_claude_code.streamed_response import ClaudeCodeStreamedResponse
+from pydantic_ai_claude_code.types import ClaudeStreamEvent
+
+# Test constants
+OUTPUT_TOKENS = 7
+MARKER = "<<<STREAM_START>>>"
+EVENT_WAIT_SECONDS = 0.05  # Long enough for the iterator to poll several times
+
+
+def _text_delta(text: str, index: int = 0) -> ClaudeStreamEvent:
+    """Build a content_block_delta text event."""
+    return {  # type: ignore[return-value]
+        "type": "content_block_delta",
+        "index": index,
+        "delta": {"type": "text_delta", "text": text},
+    }
+
+
+async def _stream(events: list[ClaudeStreamEvent]) -> AsyncIterator[ClaudeStreamEvent]:
+    """Yield the given events as a fake CLI stream."""
+    for event in events:
+        yield event
+
+
+def _make_response(
+    events: list[ClaudeStreamEvent], streaming_marker: str | None = MARKER
+) -> ClaudeCodeStreamedResponse:
+    """Create a streamed response over a fake event stream."""
+    return ClaudeCodeStreamedResponse(
+        model_request_parameters=ModelRequestParameters(),
+        model_name="sonnet",
+        event_stream=_stream(events),
+        streaming_marker=streaming_marker,
+    )
+
+
+def _streamed_text(response: ClaudeCodeStreamedResponse) -> str:
+    """Concatenate the text carried by buffered part events."""
+    text = ""
+    for event in response._buffered_events:
+        if isinstance(event, PartStartEvent):
+            text += event.part.content  # type: ignore[union-attr]
+        elif isinstance(event, PartDeltaEvent):
+            text += event.delta.content_delta  # type: ignore[union-attr]
+    return text
+
+
+class TestStreamedResponseBackgroundConsumption:
+    """Test buffering of CLI stream events by the background task."""
+
+    async def test_buffers_text_deltas_and_result(self):
+        """Test that text deltas become part events followed by a final result."""
+        response = _make_response(
+            [
+                {"type": "message_start"},  # type: ignore[list-item]
+                _text_delta(MARKER),
+                _text_delta("Hello"),
+                _text_delta(", world"),
+                {"type": "message_stop"},  # type: ignore[list-item]
+                {"type": "result", "usage": {"output_tokens": OUTPUT_TOKENS}},  # type: ignore[list-item]
+            ]
+        )
+        await response._stream_complete
+
+        assert _streamed_text(response) == "Hello, world"
+        assert isinstance(response._buffered_events[-1], FinalResultEvent)
+        assert response.usage().output_tokens == OUTPUT_TOKENS
+
+    async def test_streams_text_after_marker(self):
+        """Test that only text following the streaming marker is emitted."""
+        response = _make_response(
+            [
+                _text_delta("thinking... <<<STREAM_"),
+                _text_delta("START>>> Hello"),
+                _text_delta(", world"),
+            ]
+        )
+        await response._stream_complete
+
+        assert isinstance(response._buffered_events[0], PartStartEvent)
+        assert _streamed_text(response) == "Hello, world"
+
+    async def test_ignores_other_content_blocks(self):
+        """Test that deltas for content blocks other than 0 are skipped."""
+        response = _make_response(
+            [
+                _text_delta(MARKER),
+                _text_delta("kept"),
+                _text_delta("dropped", index=1),
+                {  # type: ignore[list-item]
+                    "type": "content_block_delta",
+                    "index": 0,
+                    "delta": {"type": "input_json_delta", "partial_json": "{}"},
+                },
+            ]
+        )
+        await response._stream_complete
+
+        assert _streamed_text(response) == "kept"
+
+    async def test_event_iterator_yields_all_buffered_events(self):
+        """Test that the event iterator drains the buffer and terminates."""
+        response = _make_response(
+            [_text_delta(MARKER), _text_delta("a"), _text_delta("b")]
+        )
+
+        events = [event async for event in response._get_event_iterator()]
+
+        assert events == response._buffered_events
+        assert _streamed_text(response) == "ab"
+
+    async def test_event_iterator_waits_on_completion_without_sleeping(
+        self, async_clock
+    ):
+        """Test that the iterator waits on the completion future, not a sleep loop."""
+        release = asyncio.Event()
+
+        async def gated_stream() -> AsyncIterator[ClaudeStreamEvent]:
+            yield _text_delta(MARKER)
+            yield _text_delta("a")
+            await release.wait()
+            yield _text_delta("b")
+
+        response = ClaudeCodeStreamedResponse(
+            model_request_parameters=ModelRequestParameters(),
+            model_name="sonnet",
+            event_stream=gated_stream(),
+            streaming_marker=MARKER,
+        )
+
+        async def consume() -> list[object]:
+            return [event async for event in response._get_event_iterator()]
+
+        consumer = asyncio.create_task(consume())
+        await asyncio.wait({consumer}, timeout=EVENT_WAIT_SECONDS)
+        assert not consumer.done()
+
+        release.set()
+        events = await consumer
+
+        assert events == response._buffered_events
+        assert _streamed_text(response) == "ab"
+        assert async_clock.sleeps == []
+
+    async def test_text_after_marker_is_not_accumulated(self):
+        """Test that chunks after the marker are forwarded without buffering."""
+        response = _make_response([])
+        await response._stream_complete
+
+        accumulated, started, text_started = response._process_marker_and_text(
+            f"{MARKER}first", "", False, False
+        )
+        for chunk in ["second", "third"]:
+            accumulated, started, text_started = response._process_marker_and_text(
+                chunk, accumulated, started, text_started
+            )
+
+        assert accumulated == "first"
+        assert started is True
+        assert text_started is True
+        assert _streamed_text(response) == "firstsecondthird"
+
+    async def test_completion_resolves_when_stream_fails(self):
+        """Test that a failing CLI stream still resolves the completion future."""
+
+        async def failing_stream() -> AsyncIterator[ClaudeStreamEvent]:
+            yield _text_delta(MARKER)
+            raise RuntimeError("Claude CLI error: boom")
+
+        response = ClaudeCodeStreamedResponse(
+            model_request_parameters=ModelRequestParameters(),
+            model_name="sonnet",
+            event_stream=failing_stream(),
+            streaming_marker=MARKER,
+        )
+
+        await response._stream_complete
+        assert response._stream_complete.result() is None
+        assert response._background_task is not None
+        with pytest.raises(RuntimeError, match="boom"):
+            await response._background_task
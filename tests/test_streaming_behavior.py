@@ -2,7 +2,6 @@
 
 from datetime import datetime
 
-import pytest
 from pydantic_ai import Agent
 
 import pydantic_ai_claude_code  # noqa: F401 - triggers registration
@@ -24,7 +23,6 @@ def get_timestamp_ms() -> float:
     return datetime.now().timestamp() * 1000
 
 
-@pytest.mark.asyncio
 async def test_streaming_delivers_chunks_incrementally():
     """Verify that chunks arrive incrementally over time, not all at once."""
     agent = Agent("claude-code:sonnet")
@@ -65,7 +63,6 @@ async def test_streaming_delivers_chunks_incrementally():
     ), f"Expected multiple gaps >{MIN_CHUNK_GAP_MS}ms between chunks, found {len(significant_gaps)}"
 
 
-@pytest.mark.asyncio
 async def test_streaming_filters_tool_use_messages():
     """Verify that tool-use messages are filtered out and only final response is streamed."""
     agent = Agent("claude-code:sonnet")
@@ -84,7 +81,6 @@ async def test_streaming_filters_tool_use_messages():
     assert len(full_text) > 50, "Should have received substantial response content"
 
 
-@pytest.mark.asyncio
 async def test_streaming_delivers_complete_response():
     """Verify that streaming delivers the complete response."""
     agent = Agent("claude-code:sonnet")
@@ -112,7 +108,6 @@ async def test_streaming_delivers_complete_response():
     assert len(final_text) > MIN_SUBSTANTIAL_CONTENT_LENGTH, "Should have substantial content"
 
 
-@pytest.mark.asyncio
 async def test_streaming_usage_available_after_completion():
     """Verify that usage information is available after streaming completes."""
     agent = Agent("claude-code:sonnet")
@@ -129,7 +124,6 @@ async def test_streaming_usage_available_after_completion():
         assert usage.input_tokens >= 0, "Should have input tokens"
 
 
-@pytest.mark.asyncio
 async def test_background_task_consumption():
     """Verify that the background task consumes events concurrently."""
     agent = Agent("claude-code:sonnet")
@@ -6,21 +6,33 @@ These tests verify that:
 3. Round-trip conversions maintain exact equality
 """
 
-import tempfile
+import os
+import threading
 from pathlib import Path
 from typing import Any
 
 import pytest
 from pydantic import BaseModel, Field
 
+from pydantic_ai_claude_code import structure_converter
 from pydantic_ai_claude_code.structure_converter import (
+    _compile_structure_instructions,
+    _FieldKind,
+    _get_field_plans,
     build_structure_instructions,
     read_structure_from_filesystem,
     write_structure_to_filesystem,
 )
 
+from .helpers import write_array
 
-def test_simple_scalar_types_round_trip():
+# Test constants
+LARGE_ARRAY_SIZE = 200  # Items in the large array tests
+GAP_INDEX = 57  # Array item left without a file
+LARGE_OBJECT_ROWS = 20  # Object array items, each with a nested large array
+
+
+def test_simple_scalar_types_round_trip(tmp_path):
     """Test round-trip conversion with simple scalar types."""
     schema = {
         "properties": {
@@ -39,46 +51,45 @@ def test_simple_scalar_types_round_trip():
         "active": True,
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
+    base_path = tmp_path / "data"
 
-        # Data → Filesystem
-        write_structure_to_filesystem(original_data, schema, base_path)
+    # Data → Filesystem
+    write_structure_to_filesystem(original_data, schema, base_path)
 
-        # Verify files exist
-        assert (base_path / "name.txt").exists()
-        assert (base_path / "age.txt").exists()
-        assert (base_path / "score.txt").exists()
-        assert (base_path / "active.txt").exists()
+    # Verify files exist
+    assert (base_path / "name.txt").exists()
+    assert (base_path / "age.txt").exists()
+    assert (base_path / "score.txt").exists()
+    assert (base_path / "active.txt").exists()
 
-        # Verify file contents
-        assert (base_path / "name.txt").read_text() == "Alice Smith"
-        assert (base_path / "age.txt").read_text() == "30"
-        assert (base_path / "score.txt").read_text() == "95.5"
-        assert (base_path / "active.txt").read_text() == "true"
+    # Verify file contents
+    assert (base_path / "name.txt").read_text() == "Alice Smith"
+    assert (base_path / "age.txt").read_text() == "30"
+    assert (base_path / "score.txt").read_text() == "95.5"
+    assert (base_path / "active.txt").read_text() == "true"
 
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
-        # Verify exact equality
-        assert loaded_data == original_data
-        assert type(loaded_data["name"]) is str
-        assert type(loaded_data["age"]) is int
-        assert type(loaded_data["score"]) is float
-        assert type(loaded_data["active"]) is bool
+    # Verify exact equality
+    assert loaded_data == original_data
+    assert type(loaded_data["name"]) is str
+    assert type(loaded_data["age"]) is int
+    assert type(loaded_data["score"]) is float
+    assert type(loaded_data["active"]) is bool
 
-        # Data → Filesystem again
-        base_path2 = Path(tmpdir) / "data2"
-        write_structure_to_filesystem(loaded_data, schema, base_path2)
+    # Data → Filesystem again
+    base_path2 = tmp_path / "data2"
+    write_structure_to_filesystem(loaded_data, schema, base_path2)
 
-        # Verify file contents are identical
-        assert (base_path2 / "name.txt").read_text() == (base_path / "name.txt").read_text()
-        assert (base_path2 / "age.txt").read_text() == (base_path / "age.txt").read_text()
-        assert (base_path2 / "score.txt").read_text() == (base_path / "score.txt").read_text()
-        assert (base_path2 / "active.txt").read_text() == (base_path / "active.txt").read_text()
+    # Verify file contents are identical
+    assert (base_path2 / "name.txt").read_text() == (base_path / "name.txt").read_text()
+    assert (base_path2 / "age.txt").read_text() == (base_path / "age.txt").read_text()
+    assert (base_path2 / "score.txt").read_text() == (base_path / "score.txt").read_text()
+    assert (base_path2 / "active.txt").read_text() == (base_path / "active.txt").read_text()
 
 
-def test_array_of_primitives_round_trip():
+def test_array_of_primitives_round_trip(tmp_path):
     """Test round-trip conversion with arrays of primitive types."""
     schema = {
         "properties": {
@@ -109,58 +120,57 @@ def test_array_of_primitives_round_trip():
         "flags": [True, False, True, False],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
+    base_path = tmp_path / "data"
 
-        # Data → Filesystem
-        write_structure_to_filesystem(original_data, schema, base_path)
+    # Data → Filesystem
+    write_structure_to_filesystem(original_data, schema, base_path)
 
-        # Verify directory structure
-        assert (base_path / "tags").is_dir()
-        assert (base_path / "scores").is_dir()
-        assert (base_path / "ratings").is_dir()
-        assert (base_path / "flags").is_dir()
+    # Verify directory structure
+    assert (base_path / "tags").is_dir()
+    assert (base_path / "scores").is_dir()
+    assert (base_path / "ratings").is_dir()
+    assert (base_path / "flags").is_dir()
 
-        # Verify array files
-        assert (base_path / "tags" / "0000.txt").read_text() == "python"
-        assert (base_path / "tags" / "0001.txt").read_text() == "ai"
-        assert (base_path / "tags" / "0002.txt").read_text() == "testing"
-        assert (base_path / "tags" / "0003.txt").read_text() == "automation"
+    # Verify array files
+    assert (base_path / "tags" / "0000.txt").read_text() == "python"
+    assert (base_path / "tags" / "0001.txt").read_text() == "ai"
+    assert (base_path / "tags" / "0002.txt").read_text() == "testing"
+    assert (base_path / "tags" / "0003.txt").read_text() == "automation"
 
-        assert (base_path / "scores" / "0000.txt").read_text() == "100"
-        assert (base_path / "scores" / "0001.txt").read_text() == "95"
+    assert (base_path / "scores" / "0000.txt").read_text() == "100"
+    assert (base_path / "scores" / "0001.txt").read_text() == "95"
 
-        assert (base_path / "ratings" / "0000.txt").read_text() == "4.5"
-        assert (base_path / "ratings" / "0001.txt").read_text() == "3.8"
+    assert (base_path / "ratings" / "0000.txt").read_text() == "4.5"
+    assert (base_path / "ratings" / "0001.txt").read_text() == "3.8"
 
-        assert (base_path / "flags" / "0000.txt").read_text() == "true"
-        assert (base_path / "flags" / "0001.txt").read_text() == "false"
+    assert (base_path / "flags" / "0000.txt").read_text() == "true"
+    assert (base_path / "flags" / "0001.txt").read_text() == "false"
 
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
-        # Verify exact equality
-        assert loaded_data == original_data
-        assert all(type(t) is str for t in loaded_data["tags"])
-        assert all(type(s) is int for s in loaded_data["scores"])
-        assert all(type(r) is float for r in loaded_data["ratings"])
-        assert all(type(f) is bool for f in loaded_data["flags"])
+    # Verify exact equality
+    assert loaded_data == original_data
+    assert all(type(t) is str for t in loaded_data["tags"])
+    assert all(type(s) is int for s in loaded_data["scores"])
+    assert all(type(r) is float for r in loaded_data["ratings"])
+    assert all(type(f) is bool for f in loaded_data["flags"])
 
-        # Data → Filesystem again
-        base_path2 = Path(tmpdir) / "data2"
-        write_structure_to_filesystem(loaded_data, schema, base_path2)
+    # Data → Filesystem again
+    base_path2 = tmp_path / "data2"
+    write_structure_to_filesystem(loaded_data, schema, base_path2)
 
-        # Verify identical file contents
-        for i in range(4):
-            assert (base_path2 / "tags" / f"{i:04d}.txt").read_text() == (
-                base_path / "tags" / f"{i:04d}.txt"
-            ).read_text()
-            assert (base_path2 / "scores" / f"{i:04d}.txt").read_text() == (
-                base_path / "scores" / f"{i:04d}.txt"
-            ).read_text()
+    # Verify identical file contents
+    for i in range(4):
+        assert (base_path2 / "tags" / f"{i:04d}.txt").read_text() == (
+            base_path / "tags" / f"{i:04d}.txt"
+        ).read_text()
+        assert (base_path2 / "scores" / f"{i:04d}.txt").read_text() == (
+            base_path / "scores" / f"{i:04d}.txt"
+        ).read_text()
 
 
-def test_nested_object_round_trip():
+def test_nested_object_round_trip(tmp_path):
     """Test round-trip conversion with nested objects."""
     schema = {
         "properties": {
@@ -199,48 +209,47 @@ def test_nested_object_round_trip():
         },
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
-
-        # Data → Filesystem
-        write_structure_to_filesystem(original_data, schema, base_path)
-
-        # Verify nested structure
-        assert (base_path / "title.txt").read_text() == "Python AI Programming"
-        assert (base_path / "author").is_dir()
-        assert (base_path / "author" / "first_name.txt").read_text() == "Alice"
-        assert (base_path / "author" / "last_name.txt").read_text() == "Johnson"
-        assert (base_path / "author" / "age.txt").read_text() == "35"
-        assert (base_path / "author" / "email.txt").read_text() == "alice@example.com"
-
-        assert (base_path / "metadata").is_dir()
-        assert (base_path / "metadata" / "version.txt").read_text() == "2"
-        assert (base_path / "metadata" / "published.txt").read_text() == "true"
-
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
-
-        # Verify exact equality
-        assert loaded_data == original_data
-        assert type(loaded_data["author"]["age"]) is int
-        assert type(loaded_data["metadata"]["version"]) is int
-        assert type(loaded_data["metadata"]["published"]) is bool
-
-        # Data → Filesystem again
-        base_path2 = Path(tmpdir) / "data2"
-        write_structure_to_filesystem(loaded_data, schema, base_path2)
-
-        # Verify identical structure
-        assert (base_path2 / "title.txt").read_text() == (base_path / "title.txt").read_text()
-        assert (base_path2 / "author" / "first_name.txt").read_text() == (
-            base_path / "author" / "first_name.txt"
-        ).read_text()
-        assert (base_path2 / "metadata" / "version.txt").read_text() == (
-            base_path / "metadata" / "version.txt"
-        ).read_text()
+    base_path = tmp_path / "data"
+
+    # Data → Filesystem
+    write_structure_to_filesystem(original_data, schema, base_path)
+
+    # Verify nested structure
+    assert (base_path / "title.txt").read_text() == "Python AI Programming"
+    assert (base_path / "author").is_dir()
+    assert (base_path / "author" / "first_name.txt").read_text() == "Alice"
+    assert (base_path / "author" / "last_name.txt").read_text() == "Johnson"
+    assert (base_path / "author" / "age.txt").read_text() == "35"
+    assert (base_path / "author" / "email.txt").read_text() == "alice@example.com"
+
+    assert (base_path / "metadata").is_dir()
+    assert (base_path / "metadata" / "version.txt").read_text() == "2"
+    assert (base_path / "metadata" / "published.txt").read_text() == "true"
+
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
+    # Verify exact equality
+    assert loaded_data == original_data
+    assert type(loaded_data["author"]["age"]) is int
+    assert type(loaded_data["metadata"]["version"]) is int
+    assert type(loaded_data["metadata"]["published"]) is bool
 
-def test_array_of_objects_round_trip():
+    # Data → Filesystem again
+    base_path2 = tmp_path / "data2"
+    write_structure_to_filesystem(loaded_data, schema, base_path2)
+
+    # Verify identical structure
+    assert (base_path2 / "title.txt").read_text() == (base_path / "title.txt").read_text()
+    assert (base_path2 / "author" / "first_name.txt").read_text() == (
+        base_path / "author" / "first_name.txt"
+    ).read_text()
+    assert (base_path2 / "metadata" / "version.txt").read_text() == (
+        base_path / "metadata" / "version.txt"
+    ).read_text()
+
+
+def test_array_of_objects_round_trip(tmp_path):
     """Test round-trip conversion with arrays of objects."""
     # Test data constant
     num_chapters = 3
@@ -273,51 +282,50 @@ def test_array_of_objects_round_trip():
         ],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
-
-        # Data → Filesystem
-        write_structure_to_filesystem(original_data, schema, base_path)
-
-        # Verify array of objects structure
-        assert (base_path / "chapters").is_dir()
-        assert (base_path / "chapters" / "0000").is_dir()
-        assert (base_path / "chapters" / "0001").is_dir()
-        assert (base_path / "chapters" / "0002").is_dir()
-
-        # Verify first chapter
-        assert (base_path / "chapters" / "0000" / "number.txt").read_text() == "1"
-        assert (base_path / "chapters" / "0000" / "title.txt").read_text() == "Introduction"
-        assert (base_path / "chapters" / "0000" / "pages.txt").read_text() == "15"
-        assert (base_path / "chapters" / "0000" / "completed.txt").read_text() == "true"
-
-        # Verify second chapter
-        assert (base_path / "chapters" / "0001" / "number.txt").read_text() == "2"
-        assert (base_path / "chapters" / "0001" / "title.txt").read_text() == "Getting Started"
-
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
-
-        # Verify exact equality
-        assert loaded_data == original_data
-        assert len(loaded_data["chapters"]) == num_chapters
-        assert all(type(ch["number"]) is int for ch in loaded_data["chapters"])
-        assert all(type(ch["pages"]) is int for ch in loaded_data["chapters"])
-        assert all(type(ch["completed"]) is bool for ch in loaded_data["chapters"])
-
-        # Data → Filesystem again
-        base_path2 = Path(tmpdir) / "data2"
-        write_structure_to_filesystem(loaded_data, schema, base_path2)
-
-        # Verify identical structure
-        for i in range(num_chapters):
-            chapter_dir = f"{i:04d}"
-            assert (base_path2 / "chapters" / chapter_dir / "number.txt").read_text() == (
-                base_path / "chapters" / chapter_dir / "number.txt"
-            ).read_text()
-            assert (base_path2 / "chapters" / chapter_dir / "title.txt").read_text() == (
-                base_path / "chapters" / chapter_dir / "title.txt"
-            ).read_text()
+    base_path = tmp_path / "data"
+
+    # Data → Filesystem
+    write_structure_to_filesystem(original_data, schema, base_path)
+
+    # Verify array of objects structure
+    assert (base_path / "chapters").is_dir()
+    assert (base_path / "chapters" / "0000").is_dir()
+    assert (base_path / "chapters" / "0001").is_dir()
+    assert (base_path / "chapters" / "0002").is_dir()
+
+    # Verify first chapter
+    assert (base_path / "chapters" / "0000" / "number.txt").read_text() == "1"
+    assert (base_path / "chapters" / "0000" / "title.txt").read_text() == "Introduction"
+    assert (base_path / "chapters" / "0000" / "pages.txt").read_text() == "15"
+    assert (base_path / "chapters" / "0000" / "completed.txt").read_text() == "true"
+
+    # Verify second chapter
+    assert (base_path / "chapters" / "0001" / "number.txt").read_text() == "2"
+    assert (base_path / "chapters" / "0001" / "title.txt").read_text() == "Getting Started"
+
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
+
+    # Verify exact equality
+    assert loaded_data == original_data
+    assert len(loaded_data["chapters"]) == num_chapters
+    assert all(type(ch["number"]) is int for ch in loaded_data["chapters"])
+    assert all(type(ch["pages"]) is int for ch in loaded_data["chapters"])
+    assert all(type(ch["completed"]) is bool for ch in loaded_data["chapters"])
+
+    # Data → Filesystem again
+    base_path2 = tmp_path / "data2"
+    write_structure_to_filesystem(loaded_data, schema, base_path2)
+
+    # Verify identical structure
+    for i in range(num_chapters):
+        chapter_dir = f"{i:04d}"
+        assert (base_path2 / "chapters" / chapter_dir / "number.txt").read_text() == (
+            base_path / "chapters" / chapter_dir / "number.txt"
+        ).read_text()
+        assert (base_path2 / "chapters" / chapter_dir / "title.txt").read_text() == (
+            base_path / "chapters" / chapter_dir / "title.txt"
+        ).read_text()
 
 
 def _verify_complex_nested_filesystem(base_path: Path) -> None:
@@ -342,7 +350,7 @@ def _verify_complex_nested_filesystem(base_path: Path) -> None:
     assert (base_path / "tags" / "0003.txt").read_text() == "beginner"
 
 
-def test_complex_deeply_nested_round_trip():
+def test_complex_deeply_nested_round_trip(tmp_path):
     """Test round-trip conversion with complex deeply nested structures."""
     # Test data constants
     num_students = 3
@@ -412,43 +420,42 @@ def test_complex_deeply_nested_round_trip():
         "tags": ["machine-learning", "ai", "python", "beginner"],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
-        write_structure_to_filesystem(original_data, schema, base_path)
-        _verify_complex_nested_filesystem(base_path)
-
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
-
-        # Verify exact equality
-        assert loaded_data == original_data
-        assert type(loaded_data["instructor"]["years_experience"]) is int
-        assert len(loaded_data["students"]) == num_students
-        assert all(type(s["student_id"]) is int for s in loaded_data["students"])
-        assert all(type(s["passed"]) is bool for s in loaded_data["students"])
-        assert all(len(s["grades"]) == num_grades_per_student for s in loaded_data["students"])
-        assert all(type(g) is float for s in loaded_data["students"] for g in s["grades"])
-
-        # Data → Filesystem again
-        base_path2 = Path(tmpdir) / "data2"
-        write_structure_to_filesystem(loaded_data, schema, base_path2)
-
-        # Verify identical structure (spot check key files)
-        assert (base_path2 / "course_name.txt").read_text() == (
-            base_path / "course_name.txt"
-        ).read_text()
-        assert (base_path2 / "instructor" / "years_experience.txt").read_text() == (
-            base_path / "instructor" / "years_experience.txt"
-        ).read_text()
-        assert (base_path2 / "students" / "0000" / "grades" / "0001.txt").read_text() == (
-            base_path / "students" / "0000" / "grades" / "0001.txt"
-        ).read_text()
-        assert (base_path2 / "students" / "0002" / "passed.txt").read_text() == (
-            base_path / "students" / "0002" / "passed.txt"
-        ).read_text()
-
-
-def test_integer_vs_float_preservation():
+    base_path = tmp_path / "data"
+    write_structure_to_filesystem(original_data, schema, base_path)
+    _verify_complex_nested_filesystem(base_path)
+
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
+
+    # Verify exact equality
+    assert loaded_data == original_data
+    assert type(loaded_data["instructor"]["years_experience"]) is int
+    assert len(loaded_data["students"]) == num_students
+    assert all(type(s["student_id"]) is int for s in loaded_data["students"])
+    assert all(type(s["passed"]) is bool for s in loaded_data["students"])
+    assert all(len(s["grades"]) == num_grades_per_student for s in loaded_data["students"])
+    assert all(type(g) is float for s in loaded_data["students"] for g in s["grades"])
+
+    # Data → Filesystem again
+    base_path2 = tmp_path / "data2"
+    write_structure_to_filesystem(loaded_data, schema, base_path2)
+
+    # Verify identical structure (spot check key files)
+    assert (base_path2 / "course_name.txt").read_text() == (
+        base_path / "course_name.txt"
+    ).read_text()
+    assert (base_path2 / "instructor" / "years_experience.txt").read_text() == (
+        base_path / "instructor" / "years_experience.txt"
+    ).read_text()
+    assert (base_path2 / "students" / "0000" / "grades" / "0001.txt").read_text() == (
+        base_path / "students" / "0000" / "grades" / "0001.txt"
+    ).read_text()
+    assert (base_path2 / "students" / "0002" / "passed.txt").read_text() == (
+        base_path / "students" / "0002" / "passed.txt"
+    ).read_text()
+
+
+def test_integer_vs_float_preservation(tmp_path):
     """Test that integer vs float types are preserved correctly."""
     schema = {
         "properties": {
@@ -473,25 +480,24 @@ def test_integer_vs_float_preservation():
         "float_array": [1.0, 2.5, 3.0],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
+    base_path = tmp_path / "data"
 
-        # Data → Filesystem
-        write_structure_to_filesystem(original_data, schema, base_path)
+    # Data → Filesystem
+    write_structure_to_filesystem(original_data, schema, base_path)
 
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
-        # Verify type preservation
-        assert loaded_data == original_data
-        assert type(loaded_data["int_value"]) is int
-        assert type(loaded_data["float_value"]) in (int, float)  # 42.0 might load as int
-        assert all(type(v) is int for v in loaded_data["int_array"])
-        # Float array should preserve float types even for whole numbers
-        assert any(type(v) is float for v in loaded_data["float_array"])
+    # Verify type preservation
+    assert loaded_data == original_data
+    assert type(loaded_data["int_value"]) is int
+    assert type(loaded_data["float_value"]) in (int, float)  # 42.0 might load as int
+    assert all(type(v) is int for v in loaded_data["int_array"])
+    # Float array should preserve float types even for whole numbers
+    assert any(type(v) is float for v in loaded_data["float_array"])
 
 
-def test_empty_arrays():
+def test_empty_arrays(tmp_path):
     """Test handling of empty arrays."""
     schema = {
         "properties": {
@@ -512,28 +518,27 @@ def test_empty_arrays():
         "scores": [],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
+    base_path = tmp_path / "data"
 
-        # Data → Filesystem
-        write_structure_to_filesystem(original_data, schema, base_path)
+    # Data → Filesystem
+    write_structure_to_filesystem(original_data, schema, base_path)
 
-        # Verify empty directories are created
-        assert (base_path / "tags").is_dir()
-        assert (base_path / "scores").is_dir()
-        assert list((base_path / "tags").glob("*.txt")) == []
-        assert list((base_path / "scores").glob("*.txt")) == []
+    # Verify empty directories are created
+    assert (base_path / "tags").is_dir()
+    assert (base_path / "scores").is_dir()
+    assert list((base_path / "tags").glob("*.txt")) == []
+    assert list((base_path / "scores").glob("*.txt")) == []
 
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
-        # Verify exact equality
-        assert loaded_data == original_data
-        assert loaded_data["tags"] == []
-        assert loaded_data["scores"] == []
+    # Verify exact equality
+    assert loaded_data == original_data
+    assert loaded_data["tags"] == []
+    assert loaded_data["scores"] == []
 
 
-def test_optional_fields_missing_from_filesystem():
+def test_optional_fields_missing_from_filesystem(tmp_path):
     """Test that optional fields missing from filesystem don't cause errors.
 
     This tests the fix for the bug where optional array/object fields
@@ -562,30 +567,29 @@ def test_optional_fields_missing_from_filesystem():
         "required": ["needs_research", "rationale"],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
-        base_path.mkdir(parents=True, exist_ok=True)
+    base_path = tmp_path / "data"
+    base_path.mkdir(parents=True, exist_ok=True)
 
-        # Create filesystem with only required fields
-        # (simulating Claude not creating optional fields)
-        (base_path / "needs_research.txt").write_text("false")
-        (base_path / "rationale.txt").write_text("This is basic math, no research needed")
+    # Create filesystem with only required fields
+    # (simulating Claude not creating optional fields)
+    (base_path / "needs_research.txt").write_text("false")
+    (base_path / "rationale.txt").write_text("This is basic math, no research needed")
 
-        # Filesystem → Data (should NOT raise error for missing optional fields)
-        loaded_data = read_structure_from_filesystem(schema, base_path)
+    # Filesystem → Data (should NOT raise error for missing optional fields)
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
-        # Verify only required fields are present
-        assert loaded_data == {
-            "needs_research": False,
-            "rationale": "This is basic math, no research needed",
-        }
-        # Optional fields should not be in the result dict
-        assert "queries" not in loaded_data
-        assert "metadata" not in loaded_data
-        assert "score" not in loaded_data
+    # Verify only required fields are present
+    assert loaded_data == {
+        "needs_research": False,
+        "rationale": "This is basic math, no research needed",
+    }
+    # Optional fields should not be in the result dict
+    assert "queries" not in loaded_data
+    assert "metadata" not in loaded_data
+    assert "score" not in loaded_data
 
 
-def test_optional_fields_partially_present():
+def test_optional_fields_partially_present(tmp_path):
     """Test that some optional fields can be present while others are missing."""
     schema = {
         "properties": {
@@ -605,30 +609,29 @@ def test_optional_fields_partially_present():
         "required": ["name"],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
-        base_path.mkdir(parents=True, exist_ok=True)
+    base_path = tmp_path / "data"
+    base_path.mkdir(parents=True, exist_ok=True)
 
-        # Create filesystem with required field + some optional fields
-        (base_path / "name.txt").write_text("Test")
-        (base_path / "tags").mkdir()
-        (base_path / "tags" / "0000.txt").write_text("tag1")
-        (base_path / "tags" / "0001.txt").write_text("tag2")
-        # metadata and score are missing
+    # Create filesystem with required field + some optional fields
+    (base_path / "name.txt").write_text("Test")
+    (base_path / "tags").mkdir()
+    (base_path / "tags" / "0000.txt").write_text("tag1")
+    (base_path / "tags" / "0001.txt").write_text("tag2")
+    # metadata and score are missing
 
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
-        # Verify partial optional fields
-        assert loaded_data == {
-            "name": "Test",
-            "tags": ["tag1", "tag2"],
-        }
-        assert "metadata" not in loaded_data
-        assert "score" not in loaded_data
+    # Verify partial optional fields
+    assert loaded_data == {
+        "name": "Test",
+        "tags": ["tag1", "tag2"],
+    }
+    assert "metadata" not in loaded_data
+    assert "score" not in loaded_data
 
 
-def test_required_fields_still_raise_errors():
+def test_required_fields_still_raise_errors(tmp_path):
     """Test that missing required fields still raise errors as expected."""
     schema = {
         "properties": {
@@ -641,16 +644,15 @@ def test_required_fields_still_raise_errors():
         "required": ["name", "tags"],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
-        base_path.mkdir(parents=True, exist_ok=True)
+    base_path = tmp_path / "data"
+    base_path.mkdir(parents=True, exist_ok=True)
 
-        # Only create name, not tags (which is required)
-        (base_path / "name.txt").write_text("Test")
+    # Only create name, not tags (which is required)
+    (base_path / "name.txt").write_text("Test")
 
-        # Should raise RuntimeError for missing required array field
-        with pytest.raises(RuntimeError, match="Missing directory.*tags"):
-            read_structure_from_filesystem(schema, base_path)
+    # Should raise RuntimeError for missing required array field
+    with pytest.raises(RuntimeError, match="Missing directory.*tags"):
+        read_structure_from_filesystem(schema, base_path)
 
 
 def _verify_ref_schema_filesystem(base_path: Path) -> None:
@@ -675,7 +677,7 @@ def _verify_ref_schema_filesystem(base_path: Path) -> None:
     assert (base_path / "tags" / "0001.txt").read_text() == "tag2"
 
 
-def test_pydantic_generated_schema_with_ref_references():
+def test_pydantic_generated_schema_with_ref_references(tmp_path):
     """Test that Pydantic-generated schemas with $ref references work correctly.
 
     This is a regression test for the bug where $ref references in array items
@@ -716,22 +718,21 @@ def test_pydantic_generated_schema_with_ref_references():
         "tags": ["tag1", "tag2"],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
-        write_structure_to_filesystem(original_data, schema, base_path)
-        _verify_ref_schema_filesystem(base_path)
+    base_path = tmp_path / "data"
+    write_structure_to_filesystem(original_data, schema, base_path)
+    _verify_ref_schema_filesystem(base_path)
 
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
-        # Verify data (note: details=None in item[1] is omitted since it's optional)
-        assert len(loaded_data["items"]) == num_items
-        assert loaded_data["items"][0]["priority"] == priority_first
-        assert loaded_data["items"][0]["action"] == "First action"
-        assert loaded_data["items"][0]["details"] == "Some details"
-        assert loaded_data["items"][1]["priority"] == priority_second
-        assert loaded_data["items"][1]["action"] == "Second action"
-        assert "details" not in loaded_data["items"][1]
+    # Verify data (note: details=None in item[1] is omitted since it's optional)
+    assert len(loaded_data["items"]) == num_items
+    assert loaded_data["items"][0]["priority"] == priority_first
+    assert loaded_data["items"][0]["action"] == "First action"
+    assert loaded_data["items"][0]["details"] == "Some details"
+    assert loaded_data["items"][1]["priority"] == priority_second
+    assert loaded_data["items"][1]["action"] == "Second action"
+    assert "details" not in loaded_data["items"][1]
 
 
 def test_build_instructions_with_ref_references():
@@ -768,7 +769,7 @@ def test_build_instructions_with_ref_references():
     assert "0000/" in items_section or "subdirectories" in items_section  # Should mention subdirectories
 
 
-def test_none_vs_empty_string_distinction():
+def test_none_vs_empty_string_distinction(tmp_path):
     """Test that None values and empty strings are handled distinctly.
 
     This is critical: None = no file, empty string = empty file.
@@ -788,33 +789,32 @@ def test_none_vs_empty_string_distinction():
         "notes": None,  # None value
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
+    base_path = tmp_path / "data"
 
-        # Data → Filesystem
-        write_structure_to_filesystem(original_data, schema, base_path)
+    # Data → Filesystem
+    write_structure_to_filesystem(original_data, schema, base_path)
 
-        # Verify: name has content
-        assert (base_path / "name.txt").exists()
-        assert (base_path / "name.txt").read_text() == "Alice"
+    # Verify: name has content
+    assert (base_path / "name.txt").exists()
+    assert (base_path / "name.txt").read_text() == "Alice"
 
-        # Verify: description is empty file (empty string)
-        assert (base_path / "description.txt").exists()
-        assert (base_path / "description.txt").read_text() == ""
+    # Verify: description is empty file (empty string)
+    assert (base_path / "description.txt").exists()
+    assert (base_path / "description.txt").read_text() == ""
 
-        # Verify: notes has no file (None)
-        assert not (base_path / "notes.txt").exists()
+    # Verify: notes has no file (None)
+    assert not (base_path / "notes.txt").exists()
 
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
-        # Verify distinction is preserved
-        assert loaded_data["name"] == "Alice"
-        assert loaded_data["description"] == ""  # Empty string preserved
-        assert "notes" not in loaded_data  # None means field omitted (optional)
+    # Verify distinction is preserved
+    assert loaded_data["name"] == "Alice"
+    assert loaded_data["description"] == ""  # Empty string preserved
+    assert "notes" not in loaded_data  # None means field omitted (optional)
 
 
-def test_none_in_primitive_arrays_creates_gaps():
+def test_none_in_primitive_arrays_creates_gaps(tmp_path):
     """Test that None values in arrays create gaps in numbering."""
     schema = {
         "properties": {
@@ -830,37 +830,36 @@ def test_none_in_primitive_arrays_creates_gaps():
         "values": ["first", None, "third", None, "fifth"],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
+    base_path = tmp_path / "data"
 
-        # Data → Filesystem
-        write_structure_to_filesystem(original_data, schema, base_path)
+    # Data → Filesystem
+    write_structure_to_filesystem(original_data, schema, base_path)
 
-        # Verify gaps in numbering
-        assert (base_path / "values" / "0000.txt").exists()
-        assert not (base_path / "values" / "0001.txt").exists()  # Gap for None
-        assert (base_path / "values" / "0002.txt").exists()
-        assert not (base_path / "values" / "0003.txt").exists()  # Gap for None
-        assert (base_path / "values" / "0004.txt").exists()
+    # Verify gaps in numbering
+    assert (base_path / "values" / "0000.txt").exists()
+    assert not (base_path / "values" / "0001.txt").exists()  # Gap for None
+    assert (base_path / "values" / "0002.txt").exists()
+    assert not (base_path / "values" / "0003.txt").exists()  # Gap for None
+    assert (base_path / "values" / "0004.txt").exists()
 
-        # Verify contents
-        assert (base_path / "values" / "0000.txt").read_text() == "first"
-        assert (base_path / "values" / "0002.txt").read_text() == "third"
-        assert (base_path / "values" / "0004.txt").read_text() == "fifth"
+    # Verify contents
+    assert (base_path / "values" / "0000.txt").read_text() == "first"
+    assert (base_path / "values" / "0002.txt").read_text() == "third"
+    assert (base_path / "values" / "0004.txt").read_text() == "fifth"
 
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
-        # Verify None values restored in correct positions
-        assert loaded_data == original_data
-        assert loaded_data["values"][0] == "first"
-        assert loaded_data["values"][1] is None
-        assert loaded_data["values"][2] == "third"
-        assert loaded_data["values"][3] is None
-        assert loaded_data["values"][4] == "fifth"
+    # Verify None values restored in correct positions
+    assert loaded_data == original_data
+    assert loaded_data["values"][0] == "first"
+    assert loaded_data["values"][1] is None
+    assert loaded_data["values"][2] == "third"
+    assert loaded_data["values"][3] is None
+    assert loaded_data["values"][4] == "fifth"
 
 
-def test_none_in_object_arrays_creates_gaps():
+def test_none_in_object_arrays_creates_gaps(tmp_path):
     """Test that None values in object arrays create gaps in subdirectories."""
     schema = {
         "properties": {
@@ -893,38 +892,37 @@ def test_none_in_object_arrays_creates_gaps():
         ],
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
-
-        # Data → Filesystem
-        write_structure_to_filesystem(original_data, schema, base_path)
-
-        # Verify gaps in subdirectory numbering
-        assert (base_path / "items" / "0000").is_dir()
-        assert not (base_path / "items" / "0001").exists()  # Gap for None
-        assert (base_path / "items" / "0002").is_dir()
-        assert not (base_path / "items" / "0003").exists()  # Gap for None
-        assert (base_path / "items" / "0004").is_dir()
+    base_path = tmp_path / "data"
 
-        # Verify contents of existing subdirectories
-        assert (base_path / "items" / "0000" / "id.txt").read_text() == "1"
-        assert (base_path / "items" / "0000" / "name.txt").read_text() == "First"
-        assert (base_path / "items" / "0002" / "id.txt").read_text() == "3"
-        assert (base_path / "items" / "0004" / "name.txt").read_text() == "Fifth"
+    # Data → Filesystem
+    write_structure_to_filesystem(original_data, schema, base_path)
 
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
-
-        # Verify None values restored in correct positions
-        assert loaded_data == original_data
-        assert loaded_data["items"][0] == {"id": 1, "name": "First"}
-        assert loaded_data["items"][1] is None
-        assert loaded_data["items"][2] == {"id": 3, "name": "Third"}
-        assert loaded_data["items"][3] is None
-        assert loaded_data["items"][4] == {"id": 5, "name": "Fifth"}
-
-
-def test_required_nullable_field_missing_returns_none():
+    # Verify gaps in subdirectory numbering
+    assert (base_path / "items" / "0000").is_dir()
+    assert not (base_path / "items" / "0001").exists()  # Gap for None
+    assert (base_path / "items" / "0002").is_dir()
+    assert not (base_path / "items" / "0003").exists()  # Gap for None
+    assert (base_path / "items" / "0004").is_dir()
+
+    # Verify contents of existing subdirectories
+    assert (base_path / "items" / "0000" / "id.txt").read_text() == "1"
+    assert (base_path / "items" / "0000" / "name.txt").read_text() == "First"
+    assert (base_path / "items" / "0002" / "id.txt").read_text() == "3"
+    assert (base_path / "items" / "0004" / "name.txt").read_text() == "Fifth"
+
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
+
+    # Verify None values restored in correct positions
+    assert loaded_data == original_data
+    assert loaded_data["items"][0] == {"id": 1, "name": "First"}
+    assert loaded_data["items"][1] is None
+    assert loaded_data["items"][2] == {"id": 3, "name": "Third"}
+    assert loaded_data["items"][3] is None
+    assert loaded_data["items"][4] == {"id": 5, "name": "Fifth"}
+
+
+def test_required_nullable_field_missing_returns_none(tmp_path):
     """Test that required nullable fields missing from filesystem return None."""
     schema = {
         "properties": {
@@ -934,22 +932,21 @@ def test_required_nullable_field_missing_returns_none():
         "required": ["name", "middle_name"],  # Both required!
     }
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        base_path = Path(tmpdir) / "data"
-        base_path.mkdir(parents=True, exist_ok=True)
+    base_path = tmp_path / "data"
+    base_path.mkdir(parents=True, exist_ok=True)
 
-        # Create only name, not middle_name
-        (base_path / "name.txt").write_text("Alice")
-        # middle_name.txt does NOT exist
+    # Create only name, not middle_name
+    (base_path / "name.txt").write_text("Alice")
+    # middle_name.txt does NOT exist
 
-        # Filesystem → Data
-        loaded_data = read_structure_from_filesystem(schema, base_path)
+    # Filesystem → Data
+    loaded_data = read_structure_from_filesystem(schema, base_path)
 
-        # middle_name is required AND nullable, so missing file = None
-        assert loaded_data == {
-            "name": "Alice",
-            "middle_name": None,
-        }
+    # middle_name is required AND nullable, so missing file = None
+    assert loaded_data == {
+        "name": "Alice",
+        "middle_name": None,
+    }
 
 
 def test_nested_list_fields_in_array_of_objects_example():
@@ -1082,5 +1079,343 @@ def test_production_model_structure_example():
     assert found_numbered_files, "Example should show numbered files under criteria_addressed/"
 
 
+def test_read_field_files_normalizes_newlines_and_decodes_utf8(tmp_path):
+    """Field files are read as UTF-8 with text-mode newline normalization."""
+    schema = {
+        "properties": {
+            "notes": {"type": "string"},
+            "lines": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["notes", "lines"],
+    }
+    (tmp_path / "notes.txt").write_bytes("Grüße\r\nzweite Zeile\rdritte\n".encode())
+    (tmp_path / "lines").mkdir()
+    (tmp_path / "lines" / "0000.txt").write_bytes(b"a\r\nb")
+
+    loaded = read_structure_from_filesystem(schema, tmp_path)
+
+    assert loaded == {"notes": "Grüße\nzweite Zeile\ndritte", "lines": ["a\nb"]}
+
+
+@pytest.mark.parametrize("size", [64 * 1024 - 1, 64 * 1024, 64 * 1024 + 1, 200 * 1024])
+def test_read_field_file_around_read_chunk_size(tmp_path, size):
+    """Field files at and beyond the first read size are read completely."""
+    schema = {"properties": {"body": {"type": "string"}}, "required": ["body"]}
+    body = "x" * (size - 3) + "end"
+    (tmp_path / "body.txt").write_text(body)
+
+    assert read_structure_from_filesystem(schema, tmp_path) == {"body": body}
+
+
+@pytest.mark.skipif(not hasattr(os, "posix_fadvise"), reason="needs posix_fadvise")
+def test_read_ahead_advised_only_for_large_field_files(tmp_path, monkeypatch):
+    """Sequential readahead is requested for large files, not for small ones."""
+    advised = []
+    monkeypatch.setattr(os, "posix_fadvise", lambda *args: advised.append(args))
+    schema = {
+        "properties": {"small": {"type": "string"}, "large": {"type": "string"}},
+        "required": ["small", "large"],
+    }
+    (tmp_path / "small.txt").write_text("tiny")
+    (tmp_path / "large.txt").write_text("x" * (200 * 1024))
+
+    read_structure_from_filesystem(schema, tmp_path)
+
+    assert [args[-1] for args in advised] == [os.POSIX_FADV_SEQUENTIAL]
+
+
+@pytest.mark.parametrize("has_readv", [True, False])
+def test_field_reads_with_and_without_scratch_buffer(tmp_path, monkeypatch, has_readv):
+    """Small and large files read the same with the reusable buffer or os.read."""
+    if has_readv and not hasattr(os, "readv"):
+        pytest.skip("needs os.readv")
+    monkeypatch.setattr(structure_converter, "_HAS_READV", has_readv)
+    schema = {
+        "properties": {
+            "small": {"type": "string"},
+            "large": {"type": "string"},
+            "tags": {"type": "array", "items": {"type": "string"}},
+        },
+        "required": ["small", "large", "tags"],
+    }
+    large = "ü" * (100 * 1024)
+    (tmp_path / "small.txt").write_text("ßmall")
+    (tmp_path / "large.txt").write_text(large)
+    write_array(tmp_path / "tags", ["longer first item", "b"])
+
+    assert read_structure_from_filesystem(schema, tmp_path) == {
+        "small": "ßmall",
+        "large": large,
+        "tags": ["longer first item", "b"],
+    }
+
+
+def test_read_structure_from_missing_directory(tmp_path):
+    """A missing structure directory raises a clear error."""
+    schema = {"properties": {"name": {"type": "string"}}, "required": ["name"]}
+
+    with pytest.raises(RuntimeError, match="Working directory not found"):
+        read_structure_from_filesystem(schema, tmp_path / "missing")
+
+
+def test_read_structure_from_file_instead_of_directory(tmp_path):
+    """A file where the structure directory is expected raises a clear error."""
+    base_path = tmp_path / "data"
+    base_path.write_text("not a directory")
+    schema = {"properties": {"name": {"type": "string"}}, "required": ["name"]}
+
+    with pytest.raises(RuntimeError, match="Expected directory but found file"):
+        read_structure_from_filesystem(schema, base_path)
+
+
+def test_field_plans_are_cached_per_schema():
+    """Equal schemas share one compiled field plan, distinct $defs do not."""
+
+    class Item(BaseModel):
+        label: str
+
+    class Container(BaseModel):
+        items: list[Item]
+        count: int | None
+
+    schema = Container.model_json_schema()
+    plans = _get_field_plans(schema, schema)
+
+    assert _get_field_plans(Container.model_json_schema(), schema) is plans
+    assert [(p.name, p.entry_name, p.required, p.nullable) for p in plans] == [
+        ("items", "items", True, False),
+        ("count", "count.txt", True, True),
+    ]
+
+    other_root = {**schema, "$defs": {"Item": {"type": "object", "properties": {}}}}
+    assert _get_field_plans(schema, other_root) is not plans
+
+
+def test_array_reading_ignores_unrelated_entries(tmp_path):
+    """Non-numbered files and directories inside array directories are ignored."""
+    schema = {
+        "properties": {
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "people": {
+                "type": "array",
+                "items": {"type": "object", "properties": {"name": {"type": "string"}}},
+            },
+        },
+        "required": ["tags", "people"],
+    }
+    tags_dir = tmp_path / "tags"
+    tags_dir.mkdir()
+    (tags_dir / "0001.txt").write_text("second")
+    (tags_dir / "0000.txt").write_text("first")
+    (tags_dir / "notes.txt").write_text("ignored")
+    (tags_dir / ".complete").touch()
+    (tags_dir / "0002.txt").mkdir()
+    people_dir = tmp_path / "people"
+    (people_dir / "0000").mkdir(parents=True)
+    (people_dir / "0000" / "name.txt").write_text("Ada")
+    (people_dir / "0001").write_text("not a directory")
+    (people_dir / "drafts").mkdir()
+
+    loaded = read_structure_from_filesystem(schema, tmp_path)
+
+    assert loaded == {"tags": ["first", "second"], "people": [{"name": "Ada"}]}
+
+
+@pytest.mark.parametrize(
+    ("field_schema", "expected_error"),
+    [
+        ({"type": "array", "items": {"type": "string"}}, "Expected directory but found file"),
+        ({"type": "object", "properties": {}}, "Expected directory but found file"),
+    ],
+)
+def test_container_field_stored_as_file_raises(tmp_path, field_schema, expected_error):
+    """Array and object fields written as plain files are reported clearly."""
+    (tmp_path / "field").write_text("oops")
+    schema = {"properties": {"field": field_schema}, "required": ["field"]}
+
+    with pytest.raises(RuntimeError, match=expected_error):
+        read_structure_from_filesystem(schema, tmp_path)
+
+
+def test_missing_nested_object_directory_raises(tmp_path):
+    """A required nested object without its directory names the expected fields."""
+    schema = {
+        "properties": {
+            "owner": {
+                "type": "object",
+                "properties": {"name": {"type": "string"}, "email": {"type": "string"}},
+            }
+        },
+        "required": ["owner"],
+    }
+
+    with pytest.raises(RuntimeError, match="Missing directory: .*owner"):
+        read_structure_from_filesystem(schema, tmp_path)
+
+
+def test_numeric_fields_accept_surrounding_whitespace(tmp_path):
+    """Numeric files with padding convert; invalid ones report stripped content."""
+    schema = {
+        "properties": {
+            "count": {"type": "integer"},
+            "ratio": {"type": "number"},
+            "scores": {"type": "array", "items": {"type": "integer"}},
+        },
+        "required": ["count", "ratio", "scores"],
+    }
+    (tmp_path / "count.txt").write_text("  42\n")
+    (tmp_path / "ratio.txt").write_text("\t0.5 \r\n")
+    write_array(tmp_path / "scores", ["7\n"])
+
+    assert read_structure_from_filesystem(schema, tmp_path) == {
+        "count": 42,
+        "ratio": 0.5,
+        "scores": [7],
+    }
+
+    (tmp_path / "count.txt").write_text("  forty-two\n")
+    with pytest.raises(RuntimeError, match="Found: 'forty-two'\n"):
+        read_structure_from_filesystem(schema, tmp_path)
+
+
+def test_large_primitive_array_keeps_order(tmp_path):
+    """Large primitive arrays keep order, gaps and errors."""
+    schema = {
+        "properties": {"values": {"type": "array", "items": {"type": "integer"}}},
+        "required": ["values"],
+    }
+    values_dir = tmp_path / "values"
+    write_array(values_dir, [str(i) for i in range(LARGE_ARRAY_SIZE)])
+    (values_dir / f"{GAP_INDEX:04d}.txt").unlink()
+
+    loaded = read_structure_from_filesystem(schema, tmp_path)["values"]
+
+    assert loaded[GAP_INDEX] is None
+    assert [v for v in loaded if v is not None] == [
+        i for i in range(LARGE_ARRAY_SIZE) if i != GAP_INDEX
+    ]
+
+    (values_dir / f"{GAP_INDEX:04d}.txt").write_text("not a number")
+    with pytest.raises(RuntimeError, match=f"{GAP_INDEX:04d}.txt"):
+        read_structure_from_filesystem(schema, tmp_path)
+
+
+def test_build_instructions_only_creates_working_directory():
+    """Field folders are left to the model, so a missing one stays an error."""
+    schema = {
+        "properties": {
+            "tags": {"type": "array", "items": {"type": "string"}},
+            "author": {"type": "object", "properties": {"name": {"type": "string"}}},
+        },
+        "required": ["tags", "author"],
+    }
+
+    instructions = build_structure_instructions(schema, "/tmp/data")
+
+    assert "mkdir -p /tmp/data\n" in instructions
+    assert "mkdir -p /tmp/data/" not in instructions
+
+
+def test_build_instructions_reuses_rendering_per_schema():
+    """Instructions are rendered once per schema and get the current directory."""
+    schema = {"properties": {"tags": {"type": "array"}}, "required": ["tags"]}
+    _compile_structure_instructions.cache_clear()
+
+    first = build_structure_instructions(schema, "/tmp/data_1")
+    second = build_structure_instructions(schema, "/tmp/data_2")
+
+    assert "mkdir -p /tmp/data_1\n" in first
+    assert "mkdir -p /tmp/data_2\n" in second
+    assert "\x00" not in second
+    assert first.replace("/tmp/data_1", "/tmp/data_2") == second
+    assert _compile_structure_instructions.cache_info().hits == 1
+
+
+def test_field_plans_precompile_nested_and_recursive_objects(tmp_path):
+    """Nested objects are planned up front; recursive $refs are planned when read."""
+
+    class Node(BaseModel):
+        label: str
+        children: list["Node"]
+
+    class Tree(BaseModel):
+        root: Node
+
+    schema = Tree.model_json_schema()
+    (root_plan,) = _get_field_plans(schema, schema)
+    (_, children_plan) = root_plan.children or ()
+
+    assert root_plan.kind is _FieldKind.OBJECT
+    assert children_plan.kind is _FieldKind.OBJECT_ARRAY
+    assert children_plan.item_type == "object"
+    assert children_plan.children is None  # Node refers back to itself
+
+    data = {
+        "root": {
+            "label": "a",
+            "children": [{"label": "b", "children": [{"label": "c", "children": []}]}],
+        }
+    }
+    write_structure_to_filesystem(data, schema, tmp_path)
+
+    assert read_structure_from_filesystem(schema, tmp_path) == data
+
+
+def test_large_object_array_with_large_nested_arrays_round_trip(
+    tmp_path, monkeypatch
+):
+    """Object items are read in order on the calling thread."""
+
+    class Row(BaseModel):
+        name: str
+        values: list[int]
+
+    class Table(BaseModel):
+        rows: list[Row]
+
+    data = {
+        "rows": [
+            {"name": f"row_{i}", "values": list(range(i, i + LARGE_ARRAY_SIZE))}
+            for i in range(LARGE_OBJECT_ROWS)
+        ]
+    }
+    schema = Table.model_json_schema()
+    write_structure_to_filesystem(data, schema, tmp_path)
+
+    read_fields = structure_converter._read_fields
+    reader_threads = set()
+
+    def recording_read_fields(*args, **kwargs):
+        reader_threads.add(threading.get_ident())
+        return read_fields(*args, **kwargs)
+
+    monkeypatch.setattr(structure_converter, "_read_fields", recording_read_fields)
+
+    assert read_structure_from_filesystem(schema, tmp_path) == data
+    assert reader_threads == {threading.get_ident()}
+
+
+def test_array_items_placed_by_index_without_sorting(tmp_path):
+    """Items land at their parsed index; equal numbers resolve to the last name."""
+    schema = {
+        "properties": {"tags": {"type": "array", "items": {"type": "string"}}},
+        "required": ["tags"],
+    }
+    tags_dir = tmp_path / "tags"
+    tags_dir.mkdir()
+    for name, value in [
+        ("0003.txt", "d"),
+        ("0000.txt", "a"),
+        ("0001.txt", "padded"),
+        ("1.txt", "b"),
+        ("-002.txt", "negative"),
+    ]:
+        (tags_dir / name).write_text(value)
+
+    assert read_structure_from_filesystem(schema, tmp_path) == {
+        "tags": ["a", "b", None, "d"]
+    }
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -1,6 +1,5 @@
 """Streamlined tests for structured output."""
 
-import pytest
 from pydantic import BaseModel
 from pydantic_ai import Agent
 
@@ -33,7 +32,6 @@ class ListResult(BaseModel):
     items: list[str]
 
 
-@pytest.mark.asyncio
 async def test_single_int():
     """Test single integer field.
 
@@ -47,7 +45,6 @@ async def test_single_int():
     assert result.output.value == EXPECTED_SUM_5_PLUS_3
 
 
-@pytest.mark.asyncio
 async def test_multi_field():
     """Test multiple fields with different types.
 
@@ -63,7 +60,6 @@ async def test_multi_field():
     assert isinstance(result.output.flag, bool)
 
 
-@pytest.mark.asyncio
 async def test_list_result():
     """Test result with list field.
 
@@ -173,7 +173,6 @@ def test_agent_tool_error_handling():
         agent.run_sync(f"Process data for customer ID {ARCHIVED_CUSTOMER_ID}")
 
 
-@pytest.mark.asyncio
 async def test_agent_tool_async():
     """Test tool calling with async agent."""
 
@@ -1,5 +1,6 @@
 """Tests for utility functions."""
 
+import json
 import os
 import shutil
 from unittest import mock
@@ -9,7 +10,11 @@ import pytest
 from pydantic_ai_claude_code.exceptions import ClaudeOAuthError
 from pydantic_ai_claude_code.types import ClaudeCodeSettings
 from pydantic_ai_claude_code.utils import (
+    _get_next_call_subdirectory,
+    _save_raw_response_to_working_dir,
     build_claude_command,
+    convert_primitive_value,
+    detect_cli_infrastructure_failure,
     detect_oauth_error,
     parse_stream_json_line,
     resolve_claude_cli_path,
@@ -412,3 +417,103 @@ def test_detect_oauth_error_vs_rate_limit_priority():
     assert is_oauth is True  # OAuth should be detected
     assert msg is not None
     assert "/login" in msg  # Message should contain OAuth instruction
+
+
+def test_save_raw_response_to_working_dir(tmp_path):
+    """Test that the raw response is persisted as readable JSON."""
+    response_file = tmp_path / "response.json"
+    # Integers beyond 64 bits must survive, not be dropped by the broad except
+    response = {"result": "Grüße", "is_error": False, "usage": {"input_tokens": 2**70}}
+
+    _save_raw_response_to_working_dir(
+        response,  # type: ignore[arg-type]
+        {"__response_file_path": str(response_file)},  # type: ignore[typeddict-unknown-key]
+    )
+
+    assert json.loads(response_file.read_text(encoding="utf-8")) == response
+
+
+def test_save_raw_response_to_missing_directory_does_not_raise(tmp_path):
+    """Test that a failed save is logged instead of raised."""
+    response_file = tmp_path / "missing" / "response.json"
+
+    _save_raw_response_to_working_dir(
+        {"result": "ok"},  # type: ignore[typeddict-item]
+        {"__response_file_path": str(response_file)},  # type: ignore[typeddict-unknown-key]
+    )
+
+    assert not response_file.exists()
+
+
+@pytest.mark.parametrize(
+    ("stderr", "expected"),
+    [
+        ("Error: Cannot find module 'yoga.wasm'", True),
+        ("code: 'MODULE_NOT_FOUND'", True),
+        ("ENOENT: no such file or directory", True),
+        ("EACCES: permission denied", True),
+        ("Some other error", False),
+        ("", False),
+    ],
+)
+def test_detect_cli_infrastructure_failure(stderr, expected):
+    """Test detection of transient CLI infrastructure failures."""
+    assert detect_cli_infrastructure_failure(stderr) is expected
+
+
+def test_detect_oauth_error_skips_json_parsing_without_indicators():
+    """Test that stdout without OAuth indicators is not JSON-parsed."""
+    stdout = '{"type":"result","is_error":true,"result":"' + "x" * 10_000 + '"}'
+
+    with mock.patch("pydantic_ai_claude_code.utils.json.loads") as loads:
+        is_oauth_error, message = detect_oauth_error(stdout, "ENOENT")
+
+    assert is_oauth_error is False
+    assert message is None
+    loads.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("true", True),
+        ("TRUE", True),
+        ("tRuE", True),
+        ("1", True),
+        ("Yes", True),
+        ("false", False),
+        ("FALSE", False),
+        ("0", False),
+        ("no", False),
+        ("nO", False),
+        ("maybe", False),
+    ],
+)
+def test_convert_primitive_value_boolean(value, expected):
+    """Test boolean conversion of true spellings; anything else is False."""
+    assert convert_primitive_value(value, "boolean") is expected
+
+
+def test_get_next_call_subdirectory_counts_numbered_directories(tmp_path):
+    """Test that only numbered directories count towards the next call number."""
+    (tmp_path / "1").mkdir()
+    (tmp_path / "2").mkdir()
+    (tmp_path / "7").write_text("numbered file, not a call directory")
+    (tmp_path / "notes").mkdir()
+
+    subdir = _get_next_call_subdirectory(str(tmp_path))
+
+    assert subdir == tmp_path / "3"
+    assert subdir.is_dir()
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [("42", 42), ("-7", -7), ("2.5", 2.5), ("1e3", 1000.0), ("1E3", 1000.0), ("x", None)],
+)
+def test_convert_primitive_value_number(value, expected):
+    """Test that numbers keep the integer vs float distinction."""
+    converted = convert_primitive_value(value, "number")
+
+    assert converted == expected
+    assert type(converted) is type(expected)